@@ -1,5 +1,6 @@
 """Application configuration via environment variables."""
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
 
@@ -22,14 +23,17 @@ class Settings(BaseSettings):
     # Security
     api_key: str = ""
     jwt_secret: str = "nile-dev-secret-change-me"  # noqa: S105
-    cors_origins: list[str] = ["http://localhost:3000"]
+    cors_origins: tuple[str, ...] = ("http://localhost:3000",)
 
     # Discord
     discord_token: str = ""
-    discord_guild_id: str = ""
+    discord_guild_id: int | None = None
+    discord_metrics_port: int = 9101  # Prometheus endpoint; 0 disables
 
     # Chain / Web3
     chain_rpc_url: str = "https://mainnet.base.org"
+    chain_ws_url: str = ""  # persistent WebSocket transport; preferred over HTTP when set
+    chain_ipc_path: str = ""  # local node IPC socket; preferred over WebSocket and HTTP
     chain_id: int = 8453  # Base mainnet
     deployer_private_key: str = ""
     factory_address: str = ""
@@ -40,5 +44,11 @@ class Settings(BaseSettings):
 
     model_config = {"env_file": ".env", "env_prefix": "NILE_"}
 
+    @field_validator("discord_guild_id", mode="before")
+    @classmethod
+    def _blank_guild_id(cls, value: object) -> object:
+        # Compose passes unset IDs through as empty strings
+        return None if value == "" else value
+
 
 settings = Settings()
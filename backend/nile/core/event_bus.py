@@ -66,8 +66,9 @@ async def event_stream() -> AsyncGenerator[str, None]:
     pubsub = r.pubsub()
     await pubsub.subscribe("nile:events")
     try:
-        async for message in pubsub.listen():
-            if message["type"] == "message":
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+            if message is not None:
                 yield f"data: {message['data']}\n\n"
     finally:
         await pubsub.unsubscribe("nile:events")
@@ -6,16 +6,26 @@ posts ecosystem events and browser screenshots of dashboard pages.
 
 import asyncio
 import contextlib
-import json
+import io
 import logging
+from collections import defaultdict
+from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime
+from itertools import islice
+from typing import Any
 
 import discord
+import orjson
 import redis.asyncio as aioredis
 from discord import app_commands
 
 from nile.config import settings
-from nile.discord.screenshots import DASHBOARD_PAGES, capture_all_pages, capture_page
+from nile.discord import metrics
+from nile.discord.screenshots import (
+    DASHBOARD_PAGES,
+    ScreenshotSession,
+    playwright_installed,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +39,7 @@ DASHBOARD_URL = "http://frontend:3000"
 NILE_CATEGORY = "NILE Security"
 
 # Channels the bot manages
-MANAGED_CHANNELS = [
+MANAGED_CHANNELS = (
     "nile-feed",
     "nile-dashboard",
     "nile-ecosystem",
@@ -37,11 +47,131 @@ MANAGED_CHANNELS = [
     "nile-attacker",
     "nile-defender",
     "nile-alerts",
-]
+)
+
+# Event types that trigger a fresh dashboard screenshot
+SCREENSHOT_TRIGGERS = frozenset({"scan.completed", "agent.joined"})
 
 # How often to post fresh screenshots (seconds)
 SCREENSHOT_INTERVAL = 3600  # every hour
 
+# Pending captures beyond this are dropped rather than piling up
+SCREENSHOT_QUEUE_SIZE = 32
+
+# Event-loop lag sampling period (seconds)
+LOOP_LAG_INTERVAL = 0.1
+
+# Discord limits per message: 10 embeds, 6000 characters across all of them
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS = 6000
+
+# Concurrent Discord sends allowed while fanning out events
+MAX_CONCURRENT_SENDS = 8
+
+# Redis connections shared by the pubsub listener and any other bot operations
+REDIS_MAX_CONNECTIONS = 10
+
+CHANNEL_TOPICS = {
+    "nile-feed": "Live ecosystem events — agents joining, vulns detected, patches verified",
+    "nile-dashboard": "Dashboard overview screenshots — updated hourly",
+    "nile-ecosystem": "Agent network graph screenshots — live ecosystem view",
+    "nile-agents": "Agent leaderboard screenshots — top agents by NILE score",
+    "nile-attacker": "Attacker KPI screenshots — exploit success, attack vectors",
+    "nile-defender": "Defender KPI screenshots — detection recall, patch rates",
+    "nile-alerts": "Critical security alerts — high severity findings",
+}
+
+EVENT_TITLES = {
+    "agent.joined": "New Agent Joined",
+    "contribution.detection": "Vulnerability Detected",
+    "contribution.patch": "Patch Submitted",
+    "contribution.exploit": "Exploit Verified",
+    "contribution.verification": "Cross-Verification",
+    "contribution.false_positive": "False Positive",
+    "scan.completed": "Scan Completed",
+    "task.claimed": "Task Claimed",
+    "task.created.patch": "Patch Task Created",
+    "task.created.exploit": "Exploit Verification Requested",
+    "knowledge.pattern_added": "New Pattern Discovered",
+    "agent.message": "Agent Communication",
+    "soul.risk_alert": "Risk Alert",
+    "soul.token_graduated": "Token Graduated",
+    "soul.oracle_confirmed": "Oracle Event Confirmed",
+    "soul.oracle_report_pending": "Oracle Report Pending",
+    "soul.valuation_changed": "Valuation Updated",
+}
+
+# Embed colors by event-type keyword, checked in order
+EVENT_COLOR_RULES = (
+    ("joined", 0x22C55E),
+    ("detection", 0xEF4444),
+    ("exploit", 0xEF4444),
+    ("patch", 0x3B82F6),
+    ("false_positive", 0xF59E0B),
+    ("alert", 0xDC2626),
+)
+DEFAULT_EVENT_COLOR = 0x6366F1
+
+
+def _match_event_color(event_type: str) -> int:
+    return next(
+        (color for keyword, color in EVENT_COLOR_RULES if keyword in event_type),
+        DEFAULT_EVENT_COLOR,
+    )
+
+
+# Known event types resolve with a single lookup; unknown ones fall back to the rules
+EVENT_COLORS = {event_type: _match_event_color(event_type) for event_type in EVENT_TITLES}
+
+
+def _describe_agent_joined(metadata: dict) -> str:
+    name = metadata.get("name", "Unknown")
+    caps = metadata.get("capabilities", [])
+    return f"**{name}** joined with capabilities: {', '.join(caps)}"
+
+
+def _describe_scan_completed(metadata: dict) -> str:
+    score = metadata.get("nile_score", "?")
+    grade = metadata.get("grade", "?")
+    return f"NILE Score: **{score}** (Grade: {grade})"
+
+
+def _describe_contribution(metadata: dict) -> str:
+    points = metadata.get("points", 0)
+    severity = metadata.get("severity", "")
+    sev_text = f" | Severity: {severity}" if severity else ""
+    return f"Points awarded: **{points}**{sev_text}"
+
+
+def _describe_metadata(metadata: dict) -> str:
+    if not metadata:
+        return ""
+    return orjson.dumps(metadata, option=orjson.OPT_INDENT_2).decode()[:200]
+
+
+# Embed descriptions by event-type keyword, checked in order after exact matches
+EVENT_DESCRIBER_RULES: tuple[tuple[str, Callable[[dict], str]], ...] = (
+    ("contribution", _describe_contribution),
+)
+
+
+def _match_describer(event_type: str) -> Callable[[dict], str]:
+    return next(
+        (describe for keyword, describe in EVENT_DESCRIBER_RULES if keyword in event_type),
+        _describe_metadata,
+    )
+
+
+EVENT_DESCRIBERS: dict[str, Callable[[dict], str]] = {
+    **{event_type: _match_describer(event_type) for event_type in EVENT_TITLES},
+    "agent.joined": _describe_agent_joined,
+    "scan.completed": _describe_scan_completed,
+}
+
+
+def _running(task: asyncio.Task | None) -> bool:
+    return task is not None and not task.done()
+
 
 class NileBot(discord.Client):
     def __init__(self) -> None:
@@ -52,11 +182,32 @@ class NileBot(discord.Client):
         self._screenshot_task: asyncio.Task | None = None
         self._target_guild: discord.Guild | None = None
         self._channels: dict[str, discord.TextChannel] = {}
+        self._page_embeds: dict[str, discord.Embed] = {}
+        # In-flight Discord sends; bounded so bursts can't trip global rate limits
+        self._send_sem = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        # One lock per channel id: channels send concurrently, each one in pubsub order
+        self._channel_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._background_tasks: set[asyncio.Task] = set()
+        # Event sends still running (a subset of the above, reported as pending sends)
+        self._event_sends: set[asyncio.Task] = set()
+        # Screenshot requests (channel, page path, name) drained by a single worker
+        self._shot_queue: asyncio.Queue[tuple[str, str, str]] = asyncio.Queue(
+            maxsize=SCREENSHOT_QUEUE_SIZE
+        )
+        self._pending_shots: set[str] = set()
+        self._shots = ScreenshotSession()
+        self._screenshots_enabled = True
+        self._screenshot_worker_task: asyncio.Task | None = None
+        self._metrics_task: asyncio.Task | None = None
 
     async def setup_hook(self) -> None:
-        self.redis = aioredis.from_url(settings.redis_url, decode_responses=True)
+        # Payloads stay as bytes; orjson parses them without a str round-trip
+        pool = aioredis.ConnectionPool.from_url(
+            settings.redis_url, max_connections=REDIS_MAX_CONNECTIONS
+        )
+        self.redis = aioredis.Redis(connection_pool=pool)
         if settings.discord_guild_id:
-            guild = discord.Object(id=int(settings.discord_guild_id))
+            guild = discord.Object(id=settings.discord_guild_id)
             self.tree.copy_global_to(guild=guild)
             await self.tree.sync(guild=guild)
         else:
@@ -66,9 +217,8 @@ class NileBot(discord.Client):
         logger.info("NILE Bot connected as %s", self.user)
 
         # Find target guild
-        guild_id = int(settings.discord_guild_id) if settings.discord_guild_id else None
-        if guild_id:
-            self._target_guild = self.get_guild(guild_id)
+        if settings.discord_guild_id:
+            self._target_guild = self.get_guild(settings.discord_guild_id)
         if not self._target_guild and self.guilds:
             self._target_guild = self.guilds[0]
 
@@ -101,9 +251,16 @@ class NileBot(discord.Client):
             except discord.Forbidden:
                 logger.warning("Cannot send to #nile-feed — missing Send Messages")
 
-        # Start background tasks
-        self._listener_task = asyncio.create_task(self._listen_events())
-        self._screenshot_task = asyncio.create_task(self._screenshot_loop())
+        # Start background tasks — on_ready fires again after every reconnect, so only
+        # start the ones that aren't already running
+        if not _running(self._listener_task):
+            self._listener_task = asyncio.create_task(self._listen_events())
+        if not _running(self._screenshot_task):
+            self._screenshot_task = asyncio.create_task(self._screenshot_loop())
+        if not _running(self._screenshot_worker_task):
+            self._screenshot_worker_task = asyncio.create_task(self._screenshot_worker())
+        if metrics.enabled() and not _running(self._metrics_task):
+            self._metrics_task = asyncio.create_task(self._loop_lag_probe())
 
     async def _ensure_channels(self) -> None:
         """Create NILE category and channels if they don't exist."""
@@ -145,8 +302,9 @@ class NileBot(discord.Client):
                 embed_links=True,
             ),
         }
+        existing_by_name = {c.name: c for c in guild.text_channels}
         for channel_name in MANAGED_CHANNELS:
-            existing = discord.utils.get(guild.text_channels, name=channel_name)
+            existing = existing_by_name.get(channel_name)
             if existing:
                 self._channels[channel_name] = existing
                 # Try to ensure we can send (ignore if no Manage Roles)
@@ -173,58 +331,147 @@ class NileBot(discord.Client):
                 except discord.Forbidden:
                     logger.warning("Cannot create #%s", channel_name)
 
+        self._build_page_embeds()
+
+    def _build_page_embeds(self) -> None:
+        """Build the static part of each dashboard page's screenshot embed."""
+        for page_info in DASHBOARD_PAGES:
+            if page_info["channel"] not in self._channels:
+                continue
+            name = page_info["name"]
+            embed = discord.Embed(
+                title=f"NILE — {name.replace('-', ' ').title()}",
+                description=f"Live dashboard: http://159.203.138.96{page_info['path']}",
+                color=0x0EA5E9,
+            )
+            embed.set_image(url=f"attachment://{name}.png")
+            self._page_embeds[name] = embed
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        """Forget a managed channel that was deleted out from under us."""
+        # Compare ids: the gateway's cached object isn't the one create_text_channel returned
+        managed = self._channels.get(channel.name)
+        if managed is not None and managed.id == channel.id:
+            del self._channels[channel.name]
+            self._channel_locks.pop(channel.id, None)
+            logger.warning("Managed channel #%s was deleted", channel.name)
+
     def _channel_topic(self, name: str) -> str:
-        topics = {
-            "nile-feed": "Live ecosystem events — agents joining, vulns detected, patches verified",
-            "nile-dashboard": "Dashboard overview screenshots — updated hourly",
-            "nile-ecosystem": "Agent network graph screenshots — live ecosystem view",
-            "nile-agents": "Agent leaderboard screenshots — top agents by NILE score",
-            "nile-attacker": "Attacker KPI screenshots — exploit success, attack vectors",
-            "nile-defender": "Defender KPI screenshots — detection recall, patch rates",
-            "nile-alerts": "Critical security alerts — high severity findings",
-        }
-        return topics.get(name, "NILE Security")
+        return CHANNEL_TOPICS.get(name, "NILE Security")
 
     # --- Event Listener ---
 
     async def _listen_events(self) -> None:
-        """Subscribe to Redis events and forward to Discord."""
+        """Subscribe to Redis events and forward to Discord in batches."""
         if not self.redis:
             return
         pubsub = self.redis.pubsub()
         await pubsub.subscribe("nile:events")
         try:
-            async for message in pubsub.listen():
-                if message["type"] != "message":
+            while True:
+                # Block until the next message; get_message skips listen()'s extra queueing
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+                if message is None:
                     continue
+                # Drain everything already buffered so a burst is routed together
+                batch = [message]
+                while (
+                    message := await pubsub.get_message(ignore_subscribe_messages=True, timeout=0)
+                ) is not None:
+                    batch.append(message)
                 try:
-                    event = json.loads(message["data"])
-                    await self._route_event(event)
+                    self._route_events(batch)
                 except Exception:
-                    logger.exception("Failed to process event")
+                    logger.exception("Failed to route event batch")
         finally:
             await pubsub.unsubscribe("nile:events")
             await pubsub.close()
 
-    async def _route_event(self, event: dict) -> None:
-        """Route ecosystem events to the right Discord channel."""
-        event_type = event.get("event_type", "")
-        metadata = event.get("metadata", {})
+    def _route_events(self, messages: list[dict]) -> None:
+        """Render a batch of pubsub messages and schedule grouped per-channel sends."""
+        grouped: dict[str, list[discord.Embed]] = {}
+        refresh_dashboard = False
+        for message in messages:
+            try:
+                event = orjson.loads(message["data"])
+                event_type = event.get("event_type", "")
+                metadata = event.get("metadata", {})
+                channel_name = self._event_channel(event_type, metadata)
+                embed = self._event_embed(event_type, metadata)
+            except Exception:
+                logger.exception("Failed to process event")
+                continue
+            grouped.setdefault(channel_name, []).append(embed)
+            if event_type in SCREENSHOT_TRIGGERS:
+                refresh_dashboard = True
+
+        # Sends run in the background so the pubsub reader keeps draining Redis
+        for channel_name, embeds in grouped.items():
+            channel = self._channels.get(channel_name)
+            if channel:
+                task = self._spawn(self._send_embeds(channel, embeds))
+                self._event_sends.add(task)
+                task.add_done_callback(self._event_sends.discard)
 
-        # Soul Token market events get special handling
-        if event_type.startswith("soul."):
-            await self._handle_soul_event(event_type, metadata)
-            return
+        # On significant events, capture a fresh screenshot
+        if refresh_dashboard:
+            self._queue_screenshot("nile-dashboard", "/", "dashboard")
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+        """Run a coroutine in the background, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _send_embeds(
+        self, channel: discord.TextChannel, embeds: list[discord.Embed]
+    ) -> None:
+        """Send embeds to a channel, packing as many per message as Discord allows.
+
+        Holds the channel's lock for the whole send, so a later batch for the same
+        channel (queued FIFO on the lock) can't overtake or interleave with this one.
+        """
+        async with self._channel_locks[channel.id]:
+            chunk: list[discord.Embed] = []
+            chunk_size = 0
+            for embed in embeds:
+                size = len(embed)
+                if chunk and (
+                    len(chunk) == MAX_EMBEDS_PER_MESSAGE
+                    or chunk_size + size > MAX_EMBED_CHARS
+                ):
+                    await self._send_embed_chunk(channel, chunk)
+                    chunk, chunk_size = [], 0
+                chunk.append(embed)
+                chunk_size += size
+            if chunk:
+                await self._send_embed_chunk(channel, chunk)
+
+    async def _send_embed_chunk(
+        self, channel: discord.TextChannel, embeds: list[discord.Embed]
+    ) -> None:
+        try:
+            async with self._send_sem:
+                await channel.send(embeds=embeds)
+        except discord.HTTPException:
+            logger.exception("Failed to send %d embed(s) to #%s", len(embeds), channel.name)
 
-        # Determine target channel
+    def _event_channel(self, event_type: str, metadata: dict) -> str:
+        """Pick the managed channel an ecosystem event is posted to."""
+        if event_type == "soul.risk_alert":
+            return "nile-alerts"
+        if event_type.startswith("soul."):
+            return "nile-feed"
         if "critical" in str(metadata.get("severity", "")):
-            channel_name = "nile-alerts"
-        else:
-            channel_name = "nile-feed"
+            return "nile-alerts"
+        return "nile-feed"
 
-        channel = self._channels.get(channel_name)
-        if not channel:
-            return
+    def _event_embed(self, event_type: str, metadata: dict) -> discord.Embed:
+        """Build the embed for an ecosystem event."""
+        # Soul Token market events get special handling
+        if event_type.startswith("soul."):
+            return self._soul_event_embed(event_type, metadata)
 
         embed = discord.Embed(
             title=self._event_title(event_type),
@@ -234,47 +481,37 @@ class NileBot(discord.Client):
         )
 
         if metadata:
-            for key, value in list(metadata.items())[:5]:
+            for key, value in islice(metadata.items(), 5):
                 embed.add_field(name=key, value=str(value), inline=True)
 
         embed.set_footer(text=f"Event: {event_type}")
-        await channel.send(embed=embed)
+        return embed
 
-        # On significant events, capture a fresh screenshot
-        if event_type in ("scan.completed", "agent.joined"):
-            asyncio.create_task(self._post_screenshot_to("nile-dashboard", "/", "dashboard"))
-
-    async def _handle_soul_event(self, event_type: str, metadata: dict) -> None:
-        """Handle Soul Token market events with rich embeds."""
+    def _soul_event_embed(self, event_type: str, metadata: dict) -> discord.Embed:
+        """Build rich embeds for Soul Token market events."""
         if event_type == "soul.risk_alert":
-            await self._post_risk_alert(metadata)
-        elif event_type == "soul.token_graduated":
-            await self._post_graduation(metadata)
-        elif event_type == "soul.oracle_confirmed":
-            await self._post_oracle_confirmed(metadata)
-        elif event_type == "soul.oracle_report_pending":
-            await self._post_oracle_pending(metadata)
-        elif event_type == "soul.valuation_changed":
-            await self._post_valuation_change(metadata)
-        else:
-            # Generic soul event to feed
-            channel = self._channels.get("nile-feed")
-            if channel:
-                embed = discord.Embed(
-                    title=f"Soul Event: {event_type.replace('soul.', '')}",
-                    color=0x6366F1,
-                    timestamp=datetime.now(UTC),
-                )
-                for k, v in list(metadata.items())[:6]:
-                    embed.add_field(name=k, value=str(v), inline=True)
-                await channel.send(embed=embed)
-
-    async def _post_risk_alert(self, m: dict) -> None:
-        """Post risk alert to #nile-alerts with severity-coded embed."""
-        channel = self._channels.get("nile-alerts")
-        if not channel:
-            return
+            return self._risk_alert_embed(metadata)
+        if event_type == "soul.token_graduated":
+            return self._graduation_embed(metadata)
+        if event_type == "soul.oracle_confirmed":
+            return self._oracle_confirmed_embed(metadata)
+        if event_type == "soul.oracle_report_pending":
+            return self._oracle_pending_embed(metadata)
+        if event_type == "soul.valuation_changed":
+            return self._valuation_change_embed(metadata)
+
+        # Generic soul event to feed
+        embed = discord.Embed(
+            title=f"Soul Event: {event_type.replace('soul.', '')}",
+            color=0x6366F1,
+            timestamp=datetime.now(UTC),
+        )
+        for k, v in islice(metadata.items(), 6):
+            embed.add_field(name=k, value=str(v), inline=True)
+        return embed
 
+    def _risk_alert_embed(self, m: dict) -> discord.Embed:
+        """Risk alert for #nile-alerts with severity-coded color."""
         severity = m.get("severity", "warning")
         risk_type = m.get("risk_type", "unknown")
         color = 0xDC2626 if severity == "critical" else 0xF59E0B
@@ -296,17 +533,13 @@ class NileBot(discord.Client):
                 inline=False,
             )
         details = m.get("details", {})
-        for k, v in list(details.items())[:4]:
+        for k, v in islice(details.items(), 4):
             embed.add_field(name=k, value=str(v), inline=True)
         embed.set_footer(text="NILE Risk Engine")
-        await channel.send(embed=embed)
-
-    async def _post_graduation(self, m: dict) -> None:
-        """Post graduation celebration to #nile-feed."""
-        channel = self._channels.get("nile-feed")
-        if not channel:
-            return
+        return embed
 
+    def _graduation_embed(self, m: dict) -> discord.Embed:
+        """Graduation celebration for #nile-feed."""
         symbol = m.get("token_symbol", "???")
         reserve = m.get("reserve_eth", 0)
         embed = discord.Embed(
@@ -321,14 +554,10 @@ class NileBot(discord.Client):
             timestamp=datetime.now(UTC),
         )
         embed.set_footer(text="NILE Soul Token Market")
-        await channel.send(embed=embed)
-
-    async def _post_oracle_confirmed(self, m: dict) -> None:
-        """Post confirmed oracle event to #nile-feed."""
-        channel = self._channels.get("nile-feed")
-        if not channel:
-            return
+        return embed
 
+    def _oracle_confirmed_embed(self, m: dict) -> discord.Embed:
+        """Confirmed oracle event for #nile-feed."""
         embed = discord.Embed(
             title="Oracle Event Confirmed",
             description=(
@@ -341,14 +570,10 @@ class NileBot(discord.Client):
             timestamp=datetime.now(UTC),
         )
         embed.set_footer(text="NILE Oracle Network")
-        await channel.send(embed=embed)
-
-    async def _post_oracle_pending(self, m: dict) -> None:
-        """Post pending oracle report for cross-verification."""
-        channel = self._channels.get("nile-feed")
-        if not channel:
-            return
+        return embed
 
+    def _oracle_pending_embed(self, m: dict) -> discord.Embed:
+        """Pending oracle report for cross-verification."""
         headline = m.get("headline", "")
         embed = discord.Embed(
             title="New Oracle Report — Awaiting Verification",
@@ -361,14 +586,10 @@ class NileBot(discord.Client):
             timestamp=datetime.now(UTC),
         )
         embed.set_footer(text="NILE Oracle Network")
-        await channel.send(embed=embed)
-
-    async def _post_valuation_change(self, m: dict) -> None:
-        """Post significant valuation change to #nile-feed."""
-        channel = self._channels.get("nile-feed")
-        if not channel:
-            return
+        return embed
 
+    def _valuation_change_embed(self, m: dict) -> discord.Embed:
+        """Significant valuation change for #nile-feed."""
         old_s = m.get("old_score", 0)
         new_s = m.get("new_score", 0)
         change = m.get("change_pct", 0)
@@ -387,115 +608,125 @@ class NileBot(discord.Client):
             timestamp=datetime.now(UTC),
         )
         embed.set_footer(text="NILE Valuation Engine")
-        await channel.send(embed=embed)
+        return embed
 
-    # --- Screenshot Loop ---
+    # --- Screenshots ---
 
     async def _screenshot_loop(self) -> None:
-        """Periodically capture and post dashboard screenshots."""
+        """Periodically queue fresh screenshots of every dashboard page."""
         # Initial delay — let services warm up
         await asyncio.sleep(30)
 
         while True:
-            try:
-                await self._post_all_screenshots()
-            except Exception:
-                logger.exception("Screenshot loop error")
+            self._queue_all_screenshots()
             await asyncio.sleep(SCREENSHOT_INTERVAL)
 
-    async def _post_all_screenshots(self) -> None:
-        """Capture all dashboard pages and post to their channels."""
-        logger.info("Capturing dashboard screenshots...")
-        screenshots = await capture_all_pages(DASHBOARD_URL)
+    def _queue_all_screenshots(self) -> int:
+        """Queue every dashboard page; returns how many are pending capture."""
+        logger.info("Queueing dashboard screenshots...")
+        return sum(
+            self._queue_screenshot(page_info["channel"], page_info["path"], page_info["name"])
+            for page_info in DASHBOARD_PAGES
+        )
 
-        for page_info in DASHBOARD_PAGES:
-            name = page_info["name"]
-            channel_name = page_info["channel"]
-            path = screenshots.get(name)
-
-            if path and path.exists():
-                channel = self._channels.get(channel_name)
-                if channel:
-                    embed = discord.Embed(
-                        title=f"NILE — {name.replace('-', ' ').title()}",
-                        description=f"Live dashboard: http://159.203.138.96{page_info['path']}",
-                        color=0x0EA5E9,
-                        timestamp=datetime.now(UTC),
-                    )
-                    file = discord.File(str(path), filename=f"{name}.png")
-                    embed.set_image(url=f"attachment://{name}.png")
-                    await channel.send(embed=embed, file=file)
-                    logger.info("Posted screenshot to #%s", channel_name)
+    def _queue_screenshot(self, channel_name: str, path: str, name: str) -> bool:
+        """Queue a page capture, dropping it if the worker is backed up."""
+        if not self._screenshots_enabled:
+            return False
+        if name in self._pending_shots:
+            return True
+        try:
+            self._shot_queue.put_nowait((channel_name, path, name))
+        except asyncio.QueueFull:
+            logger.warning("Screenshot queue full — dropping %s", name)
+            return False
+        self._pending_shots.add(name)
+        return True
+
+    async def _screenshot_worker(self) -> None:
+        """Capture queued pages one at a time with a persistent browser."""
+        if not playwright_installed():
+            self._screenshots_enabled = False
+            return
+        # A failed launch isn't fatal — capture() relaunches the browser on the next page
+        await self._shots.start()
+        try:
+            while True:
+                channel_name, path, name = await self._shot_queue.get()
+                self._pending_shots.discard(name)
+                try:
+                    png = await self._shots.capture(DASHBOARD_URL, path)
+                    if png:
+                        # Upload in the background while the next page renders
+                        self._spawn(self._post_screenshot(channel_name, name, png))
+                except Exception:
+                    logger.exception("Screenshot worker error")
+                finally:
+                    self._shot_queue.task_done()
+        finally:
+            await self._shots.close()
+
+    async def _post_screenshot(self, channel_name: str, name: str, png: bytes) -> None:
+        """Post a captured page to its channel."""
+        channel = self._channels.get(channel_name)
+        if not channel:
+            return
+        template = self._page_embeds.get(name)
+        if template:
+            embed = template.copy()
+            embed.timestamp = datetime.now(UTC)
+        else:
+            embed = discord.Embed(
+                title=f"NILE — {name.replace('-', ' ').title()}",
+                color=0x0EA5E9,
+                timestamp=datetime.now(UTC),
+            )
+            embed.set_image(url=f"attachment://{name}.png")
+        await self._send_screenshot(channel, embed, name, png)
 
-    async def _post_screenshot_to(
-        self, channel_name: str, path: str, name: str
+    async def _send_screenshot(
+        self, channel: discord.TextChannel, embed: discord.Embed, name: str, png: bytes
     ) -> None:
-        """Capture a single page and post to a specific channel."""
-        screenshot = await capture_page(DASHBOARD_URL, path, name)
-        if screenshot and screenshot.exists():
-            channel = self._channels.get(channel_name)
-            if channel:
-                embed = discord.Embed(
-                    title=f"NILE — {name.replace('-', ' ').title()} (Updated)",
-                    color=0x0EA5E9,
-                    timestamp=datetime.now(UTC),
-                )
-                file = discord.File(str(screenshot), filename=f"{name}.png")
-                embed.set_image(url=f"attachment://{name}.png")
-                await channel.send(embed=embed, file=file)
+        """Upload an in-memory PNG with its embed."""
+        file = discord.File(io.BytesIO(png), filename=f"{name}.png")
+        try:
+            await channel.send(embed=embed, file=file)
+        except discord.HTTPException:
+            logger.exception("Failed to post screenshot to #%s", channel.name)
+            return
+        logger.info("Posted screenshot to #%s", channel.name)
+
+    # --- Telemetry ---
+
+    async def _loop_lag_probe(self) -> None:
+        """Sample event-loop lag and backlog sizes for the metrics endpoint."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(LOOP_LAG_INTERVAL)
+            metrics.record_loop(
+                lag=loop.time() - started - LOOP_LAG_INTERVAL,
+                tasks=len(asyncio.all_tasks()),
+                pending_sends=len(self._event_sends),
+                screenshot_queue=self._shot_queue.qsize(),
+            )
 
     # --- Helpers ---
 
     def _event_title(self, event_type: str) -> str:
-        titles = {
-            "agent.joined": "New Agent Joined",
-            "contribution.detection": "Vulnerability Detected",
-            "contribution.patch": "Patch Submitted",
-            "contribution.exploit": "Exploit Verified",
-            "contribution.verification": "Cross-Verification",
-            "contribution.false_positive": "False Positive",
-            "scan.completed": "Scan Completed",
-            "task.claimed": "Task Claimed",
-            "task.created.patch": "Patch Task Created",
-            "task.created.exploit": "Exploit Verification Requested",
-            "knowledge.pattern_added": "New Pattern Discovered",
-            "agent.message": "Agent Communication",
-            "soul.risk_alert": "Risk Alert",
-            "soul.token_graduated": "Token Graduated",
-            "soul.oracle_confirmed": "Oracle Event Confirmed",
-            "soul.oracle_report_pending": "Oracle Report Pending",
-            "soul.valuation_changed": "Valuation Updated",
-        }
-        return titles.get(event_type, event_type)
+        return EVENT_TITLES.get(event_type, event_type)
 
     def _event_description(self, event_type: str, metadata: dict) -> str:
-        if event_type == "agent.joined":
-            name = metadata.get("name", "Unknown")
-            caps = metadata.get("capabilities", [])
-            return f"**{name}** joined with capabilities: {', '.join(caps)}"
-        if event_type == "scan.completed":
-            score = metadata.get("nile_score", "?")
-            grade = metadata.get("grade", "?")
-            return f"NILE Score: **{score}** (Grade: {grade})"
-        if "contribution" in event_type:
-            points = metadata.get("points", 0)
-            severity = metadata.get("severity", "")
-            sev_text = f" | Severity: {severity}" if severity else ""
-            return f"Points awarded: **{points}**{sev_text}"
-        return json.dumps(metadata, indent=2)[:200] if metadata else ""
+        describe = EVENT_DESCRIBERS.get(event_type)
+        if describe is None:
+            describe = _match_describer(event_type)
+        return describe(metadata)
 
     def _event_color(self, event_type: str) -> int:
-        if "joined" in event_type:
-            return 0x22C55E
-        if "detection" in event_type or "exploit" in event_type:
-            return 0xEF4444
-        if "patch" in event_type:
-            return 0x3B82F6
-        if "false_positive" in event_type:
-            return 0xF59E0B
-        if "alert" in event_type:
-            return 0xDC2626
-        return 0x6366F1
+        color = EVENT_COLORS.get(event_type)
+        if color is None:
+            color = _match_event_color(event_type)
+        return color
 
 
 bot = NileBot()
@@ -503,35 +734,41 @@ bot = NileBot()
 
 # --- Slash Commands ---
 
-
-@bot.tree.command(name="nile-status", description="NILE ecosystem status")
-async def nile_status(interaction: discord.Interaction) -> None:
-    embed = discord.Embed(
-        title="NILE Ecosystem Status",
-        color=0x0EA5E9,
-        timestamp=datetime.now(UTC),
-    )
-    embed.add_field(name="Status", value="Online", inline=True)
-    embed.add_field(name="Version", value="0.2.0", inline=True)
-    embed.add_field(
+# Static command embeds, built once; handlers copy them to add a timestamp
+STATUS_EMBED = (
+    discord.Embed(title="NILE Ecosystem Status", color=0x0EA5E9)
+    .add_field(name="Status", value="Online", inline=True)
+    .add_field(name="Version", value="0.2.0", inline=True)
+    .add_field(
         name="Dashboard",
         value="[http://159.203.138.96](http://159.203.138.96)",
         inline=False,
     )
-    embed.set_footer(text="NILE Security Intelligence Platform")
+    .set_footer(text="NILE Security Intelligence Platform")
+)
+
+LEADERBOARD_FALLBACK_EMBED = discord.Embed(
+    title="Agent Leaderboard",
+    description="[View on Dashboard](http://159.203.138.96/agents)",
+    color=0x0EA5E9,
+)
+
+
+@bot.tree.command(name="nile-status", description="NILE ecosystem status")
+async def nile_status(interaction: discord.Interaction) -> None:
+    embed = STATUS_EMBED.copy()
+    embed.timestamp = datetime.now(UTC)
     await interaction.response.send_message(embed=embed)
 
 
 @bot.tree.command(name="nile-screenshot", description="Capture fresh dashboard screenshots")
 async def nile_screenshot(interaction: discord.Interaction) -> None:
     await interaction.response.defer(thinking=True)
-    screenshots = await capture_all_pages(DASHBOARD_URL)
-    count = len(screenshots)
+    count = bot._queue_all_screenshots()
     if count > 0:
         await interaction.followup.send(
-            f"Captured {count} screenshots. Check the NILE channels!"
+            f"Capturing {count} screenshots. Check the NILE channels!"
         )
-        await bot._post_all_screenshots()
     else:
         await interaction.followup.send(
             "Could not capture screenshots. Playwright may not be installed."
@@ -541,9 +778,10 @@ async def nile_screenshot(interaction: discord.Interaction) -> None:
 @bot.tree.command(name="nile-leaderboard", description="Top agents by points")
 async def nile_leaderboard(interaction: discord.Interaction) -> None:
     await interaction.response.defer()
-    screenshot = await capture_page(DASHBOARD_URL, "/agents", "leaderboard")
-    if screenshot and screenshot.exists():
-        file = discord.File(str(screenshot), filename="leaderboard.png")
+    # Shares the worker's browser, so the command doesn't cold-start Chromium
+    png = await bot._shots.capture(DASHBOARD_URL, "/agents")
+    if png:
+        file = discord.File(io.BytesIO(png), filename="leaderboard.png")
         embed = discord.Embed(
             title="Agent Leaderboard",
             description="[View Full Dashboard](http://159.203.138.96/agents)",
@@ -552,12 +790,7 @@ async def nile_leaderboard(interaction: discord.Interaction) -> None:
         embed.set_image(url="attachment://leaderboard.png")
         await interaction.followup.send(embed=embed, file=file)
     else:
-        embed = discord.Embed(
-            title="Agent Leaderboard",
-            description="[View on Dashboard](http://159.203.138.96/agents)",
-            color=0x0EA5E9,
-        )
-        await interaction.followup.send(embed=embed)
+        await interaction.followup.send(embed=LEADERBOARD_FALLBACK_EMBED)
 
 
 def run_bot() -> None:
@@ -565,6 +798,14 @@ def run_bot() -> None:
     if not settings.discord_token:
         logger.error("NILE_DISCORD_TOKEN not set. Bot will not start.")
         return
+    try:
+        # Installed with uvicorn[standard] on non-Windows platforms
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not available — using the default asyncio event loop")
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    metrics.start_metrics_server(settings.discord_metrics_port)
     bot.run(settings.discord_token)
 
 
@@ -0,0 +1,57 @@
+"""Event-loop health metrics for the Discord bot, exported to Prometheus.
+
+prometheus-client is optional (``pip install nile-security[metrics]``);
+without it the bot runs exactly as before and nothing is sampled.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from prometheus_client import Gauge, start_http_server
+except ImportError:
+    Gauge = None
+    start_http_server = None
+
+if Gauge is not None:
+    LOOP_LAG = Gauge(
+        "nile_bot_event_loop_lag_seconds",
+        "Delay between a scheduled wake-up and when the event loop ran it",
+    )
+    TASK_COUNT = Gauge("nile_bot_asyncio_tasks", "Asyncio tasks alive in the bot process")
+    PENDING_SENDS = Gauge(
+        "nile_bot_pending_sends", "Event batches waiting to be sent to Discord"
+    )
+    SCREENSHOT_QUEUE = Gauge(
+        "nile_bot_screenshot_queue_size", "Screenshot captures waiting for the worker"
+    )
+
+_enabled = False
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def start_metrics_server(port: int) -> bool:
+    """Expose /metrics on the given port. Returns False when metrics are off."""
+    global _enabled
+    if not port:
+        return False
+    if start_http_server is None:
+        logger.info("prometheus-client not installed — bot metrics disabled")
+        return False
+    start_http_server(port)
+    _enabled = True
+    logger.info("Bot metrics listening on :%d", port)
+    return True
+
+
+def record_loop(lag: float, tasks: int, pending_sends: int, screenshot_queue: int) -> None:
+    if not _enabled:
+        return
+    LOOP_LAG.set(max(0.0, lag))
+    TASK_COUNT.set(tasks)
+    PENDING_SENDS.set(pending_sends)
+    SCREENSHOT_QUEUE.set(screenshot_queue)
@@ -1,66 +1,111 @@
 """Browser screenshot service — captures dashboard pages for Discord."""
 
+import asyncio
 import logging
-from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
-SCREENSHOT_DIR = Path("/tmp/nile-screenshots")  # noqa: S108
-SCREENSHOT_DIR.mkdir(exist_ok=True)
-
 # Pages to capture with their target channels
-DASHBOARD_PAGES = [
+DASHBOARD_PAGES = (
     {"path": "/", "name": "dashboard", "channel": "nile-dashboard"},
     {"path": "/ecosystem", "name": "ecosystem", "channel": "nile-ecosystem"},
     {"path": "/agents", "name": "agents", "channel": "nile-agents"},
     {"path": "/kpis/attacker", "name": "attacker-kpis", "channel": "nile-attacker"},
     {"path": "/kpis/defender", "name": "defender-kpis", "channel": "nile-defender"},
-]
+)
+
+BROWSER_ARGS = ["--no-sandbox", "--disable-gpu"]
+VIEWPORT = {"width": 1440, "height": 900}
 
 
-async def capture_page(base_url: str, path: str, name: str) -> Path | None:
-    """Capture a screenshot of a dashboard page using Playwright."""
+def playwright_installed() -> bool:
+    """Whether Playwright can be imported at all (vs. a browser failing to launch)."""
     try:
-        from playwright.async_api import async_playwright
+        import playwright.async_api  # noqa: F401
     except ImportError:
         logger.warning("Playwright not installed. Run: playwright install chromium")
-        return None
+        return False
+    return True
 
-    output_path = SCREENSHOT_DIR / f"{name}.png"
 
+async def _screenshot(browser: Any, base_url: str, path: str) -> bytes:
+    """Render one page in a fresh tab of an already-running browser as PNG bytes."""
+    page = await browser.new_page(viewport=VIEWPORT)
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=["--no-sandbox", "--disable-gpu"],
+        # Set dark background to match dashboard
+        await page.emulate_media(color_scheme="dark")
+
+        url = f"{base_url}{path}"
+        await page.goto(url, wait_until="networkidle", timeout=30000)
+
+        # Wait for content to render
+        await page.wait_for_timeout(2000)
+
+        png = await page.screenshot(full_page=False)
+        logger.info("Screenshot captured: %s (%d bytes)", url, len(png))
+        return png
+    finally:
+        await page.close()
+
+
+class ScreenshotSession:
+    """Long-lived headless Chromium reused across captures.
+
+    Launching Playwright costs seconds, so the bot keeps one browser open for the
+    screenshot worker and slash commands, and only opens a new tab per page.
+    """
+
+    def __init__(self) -> None:
+        self._playwright: Any = None
+        self._browser: Any = None
+        # Held while (re)launching, so concurrent captures share one browser launch
+        self._launch_lock = asyncio.Lock()
+
+    async def start(self) -> bool:
+        """Launch the browser unless it is already up. Returns False if that fails."""
+        async with self._launch_lock:
+            return self._connected() or await self._restart()
+
+    async def capture(self, base_url: str, path: str) -> bytes | None:
+        """Capture a page, relaunching the browser if it has gone away."""
+        if not self._connected() and not await self.start():
+            return None
+        try:
+            return await _screenshot(self._browser, base_url, path)
+        except Exception:
+            logger.exception("Failed to capture screenshot for %s", path)
+            return None
+
+    async def close(self) -> None:
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                logger.debug("Screenshot browser already closed", exc_info=True)
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def _connected(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    async def _restart(self) -> bool:
+        await self.close()
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            logger.warning("Playwright not installed. Run: playwright install chromium")
+            return False
+
+        try:
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=True, args=BROWSER_ARGS
             )
-            page = await browser.new_page(viewport={"width": 1440, "height": 900})
-
-            # Set dark background to match dashboard
-            await page.emulate_media(color_scheme="dark")
-
-            url = f"{base_url}{path}"
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-
-            # Wait for content to render
-            await page.wait_for_timeout(2000)
-
-            await page.screenshot(path=str(output_path), full_page=False)
-            await browser.close()
-
-            logger.info("Screenshot captured: %s -> %s", url, output_path)
-            return output_path
-
-    except Exception:
-        logger.exception("Failed to capture screenshot for %s", path)
-        return None
-
-
-async def capture_all_pages(base_url: str) -> dict[str, Path]:
-    """Capture screenshots of all dashboard pages."""
-    results = {}
-    for page_info in DASHBOARD_PAGES:
-        path = await capture_page(base_url, page_info["path"], page_info["name"])
-        if path:
-            results[page_info["name"]] = path
-    return results
+        except Exception:
+            logger.exception("Failed to launch screenshot browser")
+            await self.close()
+            return False
+        return True
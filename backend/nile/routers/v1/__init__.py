@@ -15,16 +15,22 @@ from nile.routers.v1.soul_tokens import router as soul_tokens_router
 from nile.routers.v1.tasks import router as tasks_router
 from nile.routers.v1.trading import router as trading_router
 
+# (router, mount prefix, OpenAPI tag) for every v1 sub-router
+ROUTERS: tuple[tuple[APIRouter, str, str], ...] = (
+    (health_router, "", "health"),
+    (contracts_router, "/contracts", "contracts"),
+    (scans_router, "/scans", "scans"),
+    (kpis_router, "/kpis", "kpis"),
+    (benchmarks_router, "/benchmarks", "benchmarks"),
+    (agents_router, "/agents", "agents"),
+    (tasks_router, "/tasks", "tasks"),
+    (events_router, "/events", "events"),
+    (persons_router, "/persons", "persons"),
+    (soul_tokens_router, "/soul-tokens", "soul-tokens"),
+    (trading_router, "/trading", "trading"),
+    (oracle_router, "/oracle", "oracle"),
+)
+
 api_router = APIRouter(prefix="/api/v1")
-api_router.include_router(health_router, tags=["health"])
-api_router.include_router(contracts_router, prefix="/contracts", tags=["contracts"])
-api_router.include_router(scans_router, prefix="/scans", tags=["scans"])
-api_router.include_router(kpis_router, prefix="/kpis", tags=["kpis"])
-api_router.include_router(benchmarks_router, prefix="/benchmarks", tags=["benchmarks"])
-api_router.include_router(agents_router, prefix="/agents", tags=["agents"])
-api_router.include_router(tasks_router, prefix="/tasks", tags=["tasks"])
-api_router.include_router(events_router, prefix="/events", tags=["events"])
-api_router.include_router(persons_router, prefix="/persons", tags=["persons"])
-api_router.include_router(soul_tokens_router, prefix="/soul-tokens", tags=["soul-tokens"])
-api_router.include_router(trading_router, prefix="/trading", tags=["trading"])
-api_router.include_router(oracle_router, prefix="/oracle", tags=["oracle"])
+for router, prefix, tag in ROUTERS:
+    api_router.include_router(router, prefix=prefix, tags=[tag])
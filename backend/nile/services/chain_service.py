@@ -1,25 +1,145 @@
 """Chain integration service — Web3 interactions for Soul Token ecosystem on Base."""
 
-import json
+import asyncio
+import functools
 import logging
+import re
+import time
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any
+
+import orjson
 
 from nile.config import settings
 
 logger = logging.getLogger(__name__)
 
+RPC_TIMEOUT_SECONDS = 10
+
+# HTTP connection pool — web3's default aiohttp session closes the socket after every call
+HTTP_POOL_SIZE = 64
+HTTP_KEEPALIVE_SECONDS = 30
+
+# Quotes per JSON-RPC batch — nodes tend to serialize very large batches
+QUOTE_BATCH_SIZE = 20
+
+# Chainlink ETH/USD on Base only moves on its heartbeat/deviation trigger
+ETH_PRICE_TTL_SECONDS = 30
+# Token pairs never change once deployed, so deployed pairs are cached (LRU)
+TOKEN_PAIR_CACHE_SIZE = 8192
+ZERO_ADDRESS = "0x" + "0" * 40
+
 # ABI paths (loaded from Foundry build output)
 ABI_DIR = Path(__file__).resolve().parent.parent.parent.parent / "contracts" / "out"
 
 
-def _load_abi(contract_name: str) -> list[dict]:
-    """Load ABI from Foundry build artifacts."""
+# Chainlink AggregatorV3Interface.latestRoundData() — selector and return types
+LATEST_ROUND_DATA_SELECTOR = "0xfeaf968c"
+LATEST_ROUND_DATA_TYPES = ("uint80", "int256", "uint256", "uint256", "uint80")
+
+# Multicall3 — deployed at the same address on every major EVM chain, including Base
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = (
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+)
+
+# (result key, BondingCurve getter selector, return type) read by get_curve_state.
+# The getters take no arguments, so the 4-byte selector is the whole calldata.
+CURVE_STATE_FIELDS = (
+    ("reserve_balance", "0xa10954fe", "uint256"),  # reserveBalance()
+    ("graduation_threshold", "0x8b0bc501", "uint256"),  # graduationThreshold()
+    ("active", "0x02fb0c5e", "bool"),  # active()
+    ("price", "0x9d1b464a", "uint256"),  # currentPrice()
+)
+
+# Hot read calls, encoded from fixed selectors like the curve getters rather than
+# resolved through contract.functions on every call: (selector, arg types, return types)
+GET_TOKEN_PAIR_CALL = ("0x179747bb", ("bytes16",), ("address", "address"))  # getTokenPair
+QUOTE_CALLS = {
+    "buy": ("0xe0dabd28", ("bytes16", "uint256"), ("uint256", "uint256")),  # quoteBuy
+    "sell": ("0xcbf95fc7", ("bytes16", "uint256"), ("uint256", "uint256")),  # quoteSell
+}
+
+
+@functools.cache
+def _load_abi(contract_name: str) -> tuple[dict, ...]:
+    """Load ABI from Foundry build artifacts (parsed once per contract)."""
     abi_path = ABI_DIR / f"{contract_name}.sol" / f"{contract_name}.json"
     if not abi_path.exists():
         logger.warning("ABI not found: %s", abi_path)
-        return []
-    data = json.loads(abi_path.read_text())
-    return data.get("abi", [])
+        return ()
+    data = orjson.loads(abi_path.read_bytes())
+    return tuple(data.get("abi", []))
+
+
+# A JSON integer literal of 19+ digits may not fit in 64 bits, which orjson reads as a float
+_WIDE_INT_LITERAL = re.compile(rb"[\[:,]\s*-?\d{19}")
+
+
+def _orjson_default(obj: Any) -> str:
+    if isinstance(obj, bytes):  # includes HexBytes
+        return "0x" + bytes.hex(obj)
+    raise TypeError
+
+
+class _OrjsonCodec:
+    """Provider mixin that encodes/decodes JSON-RPC payloads with orjson.
+
+    Anything orjson can't encode (ints over 64 bits, AttributeDicts, models) falls
+    back to web3's own json encoder. Responses with an integer literal that might
+    not fit in 64 bits are decoded by web3 too, since orjson would lose precision.
+    Node responses carry quantities as hex strings, so that fallback is rare.
+    """
+
+    def encode_rpc_dict(self, rpc_dict: dict) -> bytes:
+        try:
+            return orjson.dumps(rpc_dict, default=_orjson_default)
+        except orjson.JSONEncodeError:
+            return super().encode_rpc_dict(rpc_dict)
+
+    def decode_rpc_response(self, raw_response: bytes) -> dict:
+        if _WIDE_INT_LITERAL.search(raw_response):
+            return super().decode_rpc_response(raw_response)
+        return orjson.loads(raw_response)
+
+
+@functools.cache
+def _with_orjson(provider_cls: type) -> type:
+    return type(f"Orjson{provider_cls.__name__}", (_OrjsonCodec, provider_cls), {})
+
+
+@functools.lru_cache(maxsize=4096)
+def _checksum(address: str) -> str:
+    """EIP-55 checksum an address, memoized since each conversion runs keccak-256."""
+    from web3 import Web3
+
+    return Web3.to_checksum_address(address)
 
 
 class ChainService:
@@ -31,26 +151,97 @@ class ChainService:
         self._router = None
         self._treasury = None
         self._oracle = None
+        self._multicall = None
+        # WebSocket/IPC providers hold one socket that has to be opened before use
+        self._persistent = False
+        self._connect_lock = asyncio.Lock()
+        self._http_session_ready = False
+        # Per-process nonce counter for the deployer so transactions go out back-to-back
+        self._nonce_lock = asyncio.Lock()
+        self._next_nonce: int | None = None
+        # Read caches: (price, expiry on the monotonic clock) and an LRU of token pairs
+        self._eth_price: tuple[float, float] | None = None
+        self._token_pairs: OrderedDict[bytes, tuple[str, str]] = OrderedDict()
 
     @property
     def w3(self):
-        """Lazy Web3 connection."""
+        """Lazy AsyncWeb3 connection; contract calls are awaitable.
+
+        Uses IPC or WebSocket when configured, otherwise HTTP.
+        """
         if self._w3 is None:
             try:
-                from web3 import Web3
+                from web3 import AsyncWeb3
 
-                self._w3 = Web3(Web3.HTTPProvider(settings.chain_rpc_url))
+                self._w3 = AsyncWeb3(self._make_provider())
             except ImportError:
                 logger.error("web3 not installed — run: pip install web3")
                 raise
         return self._w3
 
+    def _make_provider(self):
+        if settings.chain_ipc_path:
+            from web3 import AsyncIPCProvider
+
+            self._persistent = True
+            return _with_orjson(AsyncIPCProvider)(
+                settings.chain_ipc_path, request_timeout=RPC_TIMEOUT_SECONDS
+            )
+        if settings.chain_ws_url:
+            from web3 import WebSocketProvider
+
+            self._persistent = True
+            return _with_orjson(WebSocketProvider)(
+                settings.chain_ws_url, request_timeout=RPC_TIMEOUT_SECONDS
+            )
+
+        from aiohttp import ClientTimeout
+        from web3 import AsyncHTTPProvider
+
+        # Keep-alive session is installed on first use by _ensure_connected
+        return _with_orjson(AsyncHTTPProvider)(
+            settings.chain_rpc_url,
+            request_kwargs={"timeout": ClientTimeout(total=RPC_TIMEOUT_SECONDS)},
+        )
+
+    async def _ensure_connected(self) -> None:
+        """Set up the transport on first use.
+
+        Over HTTP that is a pooled keep-alive session; for WebSocket/IPC it opens the
+        persistent socket, and reopens it if it has dropped.
+        """
+        provider = self.w3.provider  # builds the provider, which sets _persistent
+        if not self._persistent:
+            if not self._http_session_ready:
+                async with self._connect_lock:
+                    if not self._http_session_ready:
+                        await self._cache_http_session(provider)
+            return
+        async with self._connect_lock:
+            listener = provider._message_listener_task
+            if listener is None or listener.done():
+                await provider.connect()
+
+    async def _cache_http_session(self, provider: Any) -> None:
+        from aiohttp import ClientSession, TCPConnector
+
+        session = ClientSession(
+            raise_for_status=True,
+            connector=TCPConnector(
+                limit=HTTP_POOL_SIZE, keepalive_timeout=HTTP_KEEPALIVE_SECONDS
+            ),
+        )
+        if await provider.cache_async_session(session) is not session:
+            # web3 already had a session for this event loop
+            await session.close()
+        self._http_session_ready = True
+
     @property
     def factory(self):
         if self._factory is None and settings.factory_address:
             abi = _load_abi("SoulTokenFactory")
             self._factory = self.w3.eth.contract(
-                address=self.w3.to_checksum_address(settings.factory_address),
+                address=_checksum(settings.factory_address),
                 abi=abi,
             )
         return self._factory
@@ -60,7 +251,7 @@ class ChainService:
         if self._router is None and settings.router_address:
             abi = _load_abi("NileRouter")
             self._router = self.w3.eth.contract(
-                address=self.w3.to_checksum_address(settings.router_address),
+                address=_checksum(settings.router_address),
                 abi=abi,
             )
         return self._router
@@ -70,23 +261,53 @@ class ChainService:
         if self._oracle is None and settings.oracle_address:
             abi = _load_abi("NileOracle")
             self._oracle = self.w3.eth.contract(
-                address=self.w3.to_checksum_address(settings.oracle_address),
+                address=_checksum(settings.oracle_address),
                 abi=abi,
             )
         return self._oracle
 
+    @property
+    def multicall(self):
+        if self._multicall is None:
+            self._multicall = self.w3.eth.contract(
+                address=_checksum(MULTICALL3_ADDRESS),
+                abi=MULTICALL3_ABI,
+            )
+        return self._multicall
+
     # --- Read Operations ---
 
+    def _call_params(self, to: str, call: tuple, *args: Any) -> dict:
+        """eth_call params for one of the pre-encoded calls above."""
+        selector, arg_types, _ = call
+        return {"to": to, "data": selector + self.w3.codec.encode(arg_types, args).hex()}
+
+    async def _read(self, to: str, call: tuple, *args: Any) -> tuple:
+        raw = await self.w3.eth.call(self._call_params(to, call, *args))
+        return self.w3.codec.decode(call[2], raw)
+
     async def get_token_pair(self, person_id: bytes) -> tuple[str, str] | None:
         """Look up token/curve addresses for a person."""
         if not self.factory:
             return None
+        pair = self._token_pairs.get(person_id)
+        if pair is not None:
+            self._token_pairs.move_to_end(person_id)
+            return pair
         try:
-            result = self.factory.functions.getTokenPair(person_id).call()
-            return (result[0], result[1])
+            await self._ensure_connected()
+            token, curve = await self._read(self.factory.address, GET_TOKEN_PAIR_CALL, person_id)
         except Exception:
             logger.exception("Failed to get token pair for %s", person_id.hex())
             return None
+        pair = (_checksum(token), _checksum(curve))
+        if token == ZERO_ADDRESS:
+            # Not deployed yet — a deploy from any process can change this, so don't cache
+            return pair
+        self._token_pairs[person_id] = pair
+        if len(self._token_pairs) > TOKEN_PAIR_CACHE_SIZE:
+            self._token_pairs.popitem(last=False)
+        return pair
 
     async def get_quote_buy(
         self, person_id: bytes, eth_amount_wei: int
@@ -95,10 +316,10 @@ class ChainService:
         if not self.router:
             return None
         try:
-            result = self.router.functions.quoteBuy(
-                person_id, eth_amount_wei
-            ).call()
-            return (result[0], result[1])
+            await self._ensure_connected()
+            return await self._read(
+                self.router.address, QUOTE_CALLS["buy"], person_id, eth_amount_wei
+            )
         except Exception:
             logger.exception("quoteBuy failed")
             return None
@@ -110,62 +331,89 @@ class ChainService:
         if not self.router:
             return None
         try:
-            result = self.router.functions.quoteSell(
-                person_id, token_amount_wei
-            ).call()
-            return (result[0], result[1])
+            await self._ensure_connected()
+            return await self._read(
+                self.router.address, QUOTE_CALLS["sell"], person_id, token_amount_wei
+            )
         except Exception:
             logger.exception("quoteSell failed")
             return None
 
+    async def get_quotes_bulk(
+        self, requests: list[tuple[bytes, int, str]]
+    ) -> list[tuple[int, int] | None]:
+        """Quote many trades at once; each request is (person_id, amount_wei, "buy"|"sell").
+
+        Requests are sent as JSON-RPC batches of QUOTE_BATCH_SIZE, with batches in
+        flight concurrently. Results line up with ``requests``; entries from a failed
+        batch are None.
+        """
+        for _, _, kind in requests:
+            if kind not in QUOTE_CALLS:
+                raise ValueError(f"Unknown quote kind: {kind!r}")
+        if not self.router:
+            return [None] * len(requests)
+        chunks = [
+            requests[i : i + QUOTE_BATCH_SIZE]
+            for i in range(0, len(requests), QUOTE_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(self._quote_batch(chunk) for chunk in chunks))
+        return [quote for chunk in results for quote in chunk]
+
+    async def _quote_batch(
+        self, requests: list[tuple[bytes, int, str]]
+    ) -> list[tuple[int, int] | None]:
+        try:
+            await self._ensure_connected()
+            router = self.router.address
+            async with self.w3.batch_requests() as batch:
+                for person_id, amount_wei, kind in requests:
+                    params = self._call_params(router, QUOTE_CALLS[kind], person_id, amount_wei)
+                    batch.add(self.w3.eth.call(params))
+                results = await batch.async_execute()
+            return [
+                self.w3.codec.decode(QUOTE_CALLS[kind][2], raw)
+                for (_, _, kind), raw in zip(requests, results, strict=True)
+            ]
+        except Exception:
+            logger.exception("Batched quote request failed")
+            return [None] * len(requests)
+
     async def get_curve_state(self, curve_address: str) -> dict | None:
-        """Read bonding curve state."""
-        abi = _load_abi("BondingCurve")
-        if not abi:
-            return None
+        """Read bonding curve state in one Multicall3 round-trip, pinned to one block."""
         try:
-            curve = self.w3.eth.contract(
-                address=self.w3.to_checksum_address(curve_address),
-                abi=abi,
-            )
+            await self._ensure_connected()
+            address = _checksum(curve_address)
+            calls = [(address, False, selector) for _, selector, _ in CURVE_STATE_FIELDS]
+            results = await self.multicall.functions.aggregate3(calls).call()
             return {
-                "reserve_balance": curve.functions.reserveBalance().call(),
-                "graduation_threshold": curve.functions.graduationThreshold().call(),
-                "active": curve.functions.active().call(),
-                "price": curve.functions.currentPrice().call(),
+                key: self.w3.codec.decode([abi_type], return_data)[0]
+                for (key, _, abi_type), (_, return_data) in zip(
+                    CURVE_STATE_FIELDS, results, strict=True
+                )
             }
         except Exception:
             logger.exception("Failed to read curve state: %s", curve_address)
             return None
 
     async def get_eth_price_usd(self) -> float | None:
-        """Get ETH/USD price from Chainlink on Base."""
-        chainlink_abi = [
-            {
-                "inputs": [],
-                "name": "latestRoundData",
-                "outputs": [
-                    {"name": "roundId", "type": "uint80"},
-                    {"name": "answer", "type": "int256"},
-                    {"name": "startedAt", "type": "uint256"},
-                    {"name": "updatedAt", "type": "uint256"},
-                    {"name": "answeredInRound", "type": "uint80"},
-                ],
-                "stateMutability": "view",
-                "type": "function",
-            }
-        ]
+        """Get ETH/USD price from Chainlink on Base, cached for ETH_PRICE_TTL_SECONDS."""
+        now = time.monotonic()
+        if self._eth_price is not None and now < self._eth_price[1]:
+            return self._eth_price[0]
         try:
-            feed = self.w3.eth.contract(
-                address=self.w3.to_checksum_address(settings.eth_price_feed),
-                abi=chainlink_abi,
+            await self._ensure_connected()
+            raw = await self.w3.eth.call(
+                {"to": _checksum(settings.eth_price_feed), "data": LATEST_ROUND_DATA_SELECTOR}
             )
-            result = feed.functions.latestRoundData().call()
-            # Chainlink ETH/USD has 8 decimals
-            return result[1] / 1e8
+            result = self.w3.codec.decode(LATEST_ROUND_DATA_TYPES, raw)
         except Exception:
             logger.exception("Failed to get ETH price")
             return None
+        # Chainlink ETH/USD has 8 decimals
+        price = result[1] / 1e8
+        self._eth_price = (price, now + ETH_PRICE_TTL_SECONDS)
+        return price
 
     # --- Write Operations (require deployer key) ---
 
@@ -175,6 +423,61 @@ class ChainService:
             raise ValueError("NILE_DEPLOYER_PRIVATE_KEY not set")
         return self.w3.eth.account.from_key(settings.deployer_private_key)
 
+    async def _reserve_nonce(self, address: str) -> int:
+        """Hand out the deployer's next nonce, syncing from the node when unknown.
+
+        The counter is per process. Only one process should send with the deployer
+        key: the API image runs several uvicorn workers, and each would count on its
+        own. A collision from another sender shows up as a failed send, which resyncs.
+        """
+        async with self._nonce_lock:
+            if self._next_nonce is None:
+                self._next_nonce = await self.w3.eth.get_transaction_count(address, "pending")
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+    async def _resync_nonce(self, nonce: int) -> None:
+        """Forget the local counter so the next reservation re-reads the node's count.
+
+        Called when a send fails or a receipt times out. The node never saw the nonce,
+        or dropped it, so it is a gap that would hold every later transaction in the
+        node's queue; the node's pending count points back at it and the next send
+        fills it. A nonce that was in flight may be handed out again; that send fails
+        as well and resyncs once more.
+        """
+        async with self._nonce_lock:
+            if self._next_nonce is not None and self._next_nonce != nonce + 1:
+                logger.warning("Deployer nonce %d failed with later nonces in flight", nonce)
+            self._next_nonce = None
+
+    async def _transact(self, fn: Any, account: Any) -> tuple[Any, dict]:
+        """Build, sign and send a contract call, then wait for it to be mined.
+
+        Gas is estimated before a nonce is reserved, so calls that revert in estimation
+        never consume one. The nonce lock only covers handing out a nonce, so
+        concurrent callers send back-to-back and wait for receipts in parallel.
+        """
+        from web3.exceptions import TimeExhausted
+
+        await self._ensure_connected()
+        tx = await fn.build_transaction({"from": account.address, "chainId": settings.chain_id})
+        nonce = await self._reserve_nonce(account.address)
+        tx["nonce"] = nonce
+        try:
+            # secp256k1 signing + RLP/keccak is pure CPU — keep it off the event loop
+            signed = await asyncio.to_thread(account.sign_transaction, tx)
+            tx_hash = await self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        except Exception:
+            await self._resync_nonce(nonce)
+            raise
+        try:
+            return tx_hash, await self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        except TimeExhausted:
+            # Possibly dropped from the mempool; don't keep counting past it
+            await self._resync_nonce(nonce)
+            raise
+
     async def deploy_soul_token(
         self, person_id: bytes, name: str, symbol: str
     ) -> tuple[str, str] | None:
@@ -185,21 +488,10 @@ class ChainService:
 
         account = self._get_account()
         try:
-            tx = self.factory.functions.createSoulToken(
-                person_id, name, symbol
-            ).build_transaction(
-                {
-                    "from": account.address,
-                    "nonce": self.w3.eth.get_transaction_count(account.address),
-                    "chainId": settings.chain_id,
-                }
-            )
-            signed = account.sign_transaction(tx)
-            tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            fn = self.factory.functions.createSoulToken(person_id, name, symbol)
+            tx_hash, receipt = await self._transact(fn, account)
 
             if receipt["status"] == 1:
-                # Parse SoulTokenCreated event for addresses
                 pair = await self.get_token_pair(person_id)
                 logger.info("Deployed soul token for %s: %s", person_id.hex(), pair)
                 return pair
@@ -215,18 +507,10 @@ class ChainService:
             return False
         account = self._get_account()
         try:
-            tx = self.oracle.functions.authorizeAgent(
-                self.w3.to_checksum_address(agent_address)
-            ).build_transaction(
-                {
-                    "from": account.address,
-                    "nonce": self.w3.eth.get_transaction_count(account.address),
-                    "chainId": settings.chain_id,
-                }
+            fn = self.oracle.functions.authorizeAgent(
+                _checksum(agent_address)
             )
-            signed = account.sign_transaction(tx)
-            tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            _, receipt = await self._transact(fn, account)
             return receipt["status"] == 1
         except Exception:
             logger.exception("Failed to authorize oracle agent")
@@ -7,10 +7,16 @@ Each contract receives a 0-100 score across four equally-weighted dimensions:
   Essence (25%):  Test coverage, complexity, upgrade risk, dependencies
 """
 
+from bisect import bisect_right
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class NameInputs:
     is_verified: bool = False
     audit_count: int = 0
@@ -19,7 +25,7 @@ class NameInputs:
     ecosystem_score: float = 0.0  # 0-20
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImageInputs:
     open_critical: int = 0
     open_high: int = 0
@@ -28,13 +34,53 @@ class ImageInputs:
     trend: float = 0.0  # -10 to +10
 
 
-@dataclass
+# Slither severity codes; anything unrecognised maps to SEVERITY_UNKNOWN
+SEVERITY_CODES = {"info": 0, "low": 1, "medium": 2, "high": 3}
+SEVERITY_UNKNOWN = 4
+SEVERITY_PENALTIES = (0, 3, 8, 15, 0)  # indexed by severity code
+
+# EVMbench confidence bands: > 0.4, > 0.6 and > 0.8 deduct 5, 10 and 20 points
+CONFIDENCE_BANDS = (0.4, 0.6, 0.8)
+
+
+@dataclass(slots=True, frozen=True)
 class LikenessInputs:
     slither_findings: list[dict] = field(default_factory=list)
     evmbench_pattern_matches: list[dict] = field(default_factory=list)
-
-
-@dataclass
+    # Derived from the findings in __post_init__ (never passed in, so they can't
+    # disagree with them): severity codes, confidences, and the folded deductions
+    slither_severities: tuple[int, ...] = field(init=False, compare=False, repr=False)
+    pattern_confidences: tuple[float, ...] = field(init=False, compare=False, repr=False)
+    slither_deductions: float = field(init=False, compare=False, repr=False)
+    pattern_deductions: float = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass — fill the derived fields through object.__setattr__
+        severities = tuple(
+            SEVERITY_CODES.get(f.get("severity", "info"), SEVERITY_UNKNOWN)
+            for f in self.slither_findings
+        )
+        confidences = tuple(m.get("confidence", 0.0) for m in self.evmbench_pattern_matches)
+        object.__setattr__(self, "slither_severities", severities)
+        object.__setattr__(self, "pattern_confidences", confidences)
+
+        penalties = SEVERITY_PENALTIES
+        object.__setattr__(
+            self, "slither_deductions", float(sum(penalties[code] for code in severities))
+        )
+        object.__setattr__(
+            self,
+            "pattern_deductions",
+            float(
+                sum(
+                    20 if c > 0.8 else 10 if c > 0.6 else 5 if c > 0.4 else 0
+                    for c in confidences
+                )
+            ),
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class EssenceInputs:
     test_coverage_pct: float = 0.0  # 0-100
     avg_cyclomatic_complexity: float = 5.0
@@ -44,7 +90,7 @@ class EssenceInputs:
     external_call_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NileScoreResult:
     total_score: float
     name_score: float
@@ -52,7 +98,22 @@ class NileScoreResult:
     likeness_score: float
     essence_score: float
     grade: str
-    details: dict
+    # Inputs the scores came from; details is built from them on demand, so a
+    # result can't be constructed without them (this replaces the old details= arg)
+    inputs: tuple[NameInputs, ImageInputs, LikenessInputs, EssenceInputs] = field(
+        repr=False, compare=False
+    )
+
+    @property
+    def details(self) -> dict:
+        """Per-dimension breakdown, computed on access rather than with the score."""
+        name_inputs, image_inputs, likeness_inputs, essence_inputs = self.inputs
+        return {
+            "name": compute_name_score(name_inputs)[1],
+            "image": compute_image_score(image_inputs)[1],
+            "likeness": compute_likeness_score(likeness_inputs)[1],
+            "essence": compute_essence_score(essence_inputs)[1],
+        }
 
 
 GRADE_MAP = [
@@ -65,18 +126,31 @@ GRADE_MAP = [
 ]
 
 
+# Ascending thresholds / letters for bisect and searchsorted grading
+GRADE_THRESHOLDS = tuple(t for t, _ in reversed(GRADE_MAP))
+GRADE_LETTERS = tuple(g for _, g in reversed(GRADE_MAP))
+
+
 def _clamp(value: float, lo: float = 0.0, hi: float = 100.0) -> float:
     return max(lo, min(hi, value))
 
 
-def compute_name_score(inputs: NameInputs) -> tuple[float, dict]:
+def grade_for(total: float) -> str:
+    """Letter grade for a 0-100 total score."""
+    return GRADE_LETTERS[max(bisect_right(GRADE_THRESHOLDS, total) - 1, 0)]
+
+
+def _name_parts(inputs: NameInputs) -> tuple[float, float, float, float, float]:
     source_score = 20.0 if inputs.is_verified else 0.0
     audit_score = min(20.0, inputs.audit_count * 6.67)
     maturity_score = min(20.0, inputs.age_days / 365 * 20) if inputs.age_days > 0 else 0.0
     team_score = 20.0 if inputs.team_identified else 5.0
     ecosystem = min(20.0, inputs.ecosystem_score)
+    return source_score, audit_score, maturity_score, team_score, ecosystem
 
-    total = _clamp(source_score + audit_score + maturity_score + team_score + ecosystem)
+
+def compute_name_score(inputs: NameInputs) -> tuple[float, dict]:
+    source_score, audit_score, maturity_score, team_score, ecosystem = _name_parts(inputs)
     details = {
         "source_verified": source_score,
         "audit_history": audit_score,
@@ -84,10 +158,11 @@ def compute_name_score(inputs: NameInputs) -> tuple[float, dict]:
         "team_identification": team_score,
         "ecosystem_presence": ecosystem,
     }
+    total = _clamp(source_score + audit_score + maturity_score + team_score + ecosystem)
     return total, details
 
 
-def compute_image_score(inputs: ImageInputs) -> tuple[float, dict]:
+def _image_parts(inputs: ImageInputs) -> tuple[float, float]:
     base = 100.0
     base -= inputs.open_critical * 25
     base -= inputs.open_high * 15
@@ -96,8 +171,11 @@ def compute_image_score(inputs: ImageInputs) -> tuple[float, dict]:
     patch_bonus = 0.0
     if inputs.avg_patch_time_days is not None:
         patch_bonus = max(0.0, 10 - inputs.avg_patch_time_days)
+    return base, patch_bonus
 
-    total = _clamp(base + patch_bonus + inputs.trend)
+
+def compute_image_score(inputs: ImageInputs) -> tuple[float, dict]:
+    base, patch_bonus = _image_parts(inputs)
     details = {
         "base_from_vulns": base,
         "patch_cadence_bonus": patch_bonus,
@@ -106,39 +184,22 @@ def compute_image_score(inputs: ImageInputs) -> tuple[float, dict]:
         "open_high": inputs.open_high,
         "open_medium": inputs.open_medium,
     }
-    return total, details
+    return _clamp(base + patch_bonus + inputs.trend), details
 
 
 def compute_likeness_score(inputs: LikenessInputs) -> tuple[float, dict]:
-    score = 100.0
-    severity_penalty = {"high": 15, "medium": 8, "low": 3, "info": 0}
-
-    slither_deductions = 0.0
-    for finding in inputs.slither_findings:
-        sev = finding.get("severity", "info")
-        slither_deductions += severity_penalty.get(sev, 0)
-
-    pattern_deductions = 0.0
-    for match in inputs.evmbench_pattern_matches:
-        confidence = match.get("confidence", 0.0)
-        if confidence > 0.8:
-            pattern_deductions += 20
-        elif confidence > 0.6:
-            pattern_deductions += 10
-        elif confidence > 0.4:
-            pattern_deductions += 5
-
-    total = _clamp(score - slither_deductions - pattern_deductions)
+    slither_deductions = inputs.slither_deductions
+    pattern_deductions = inputs.pattern_deductions
     details = {
         "slither_deductions": slither_deductions,
         "pattern_match_deductions": pattern_deductions,
-        "slither_finding_count": len(inputs.slither_findings),
-        "evmbench_match_count": len(inputs.evmbench_pattern_matches),
+        "slither_finding_count": len(inputs.slither_severities),
+        "evmbench_match_count": len(inputs.pattern_confidences),
     }
-    return total, details
+    return _clamp(100.0 - slither_deductions - pattern_deductions), details
 
 
-def compute_essence_score(inputs: EssenceInputs) -> tuple[float, dict]:
+def _essence_parts(inputs: EssenceInputs) -> tuple[float, float, float, float]:
     coverage = min(25.0, inputs.test_coverage_pct * 0.25)
     complexity_score = max(0.0, 25 - (inputs.avg_cyclomatic_complexity - 5) * 2.5)
     complexity_score = min(25.0, complexity_score)
@@ -152,15 +213,18 @@ def compute_essence_score(inputs: EssenceInputs) -> tuple[float, dict]:
         upgrade_score -= 5
 
     dep_score = max(0.0, 25 - inputs.external_call_count * 2)
+    return coverage, complexity_score, upgrade_score, dep_score
+
 
-    total = _clamp(coverage + complexity_score + upgrade_score + dep_score)
+def compute_essence_score(inputs: EssenceInputs) -> tuple[float, dict]:
+    coverage, complexity_score, upgrade_score, dep_score = _essence_parts(inputs)
     details = {
         "test_coverage": coverage,
         "complexity": complexity_score,
         "upgrade_risk": upgrade_score,
         "dependency_risk": dep_score,
     }
-    return total, details
+    return _clamp(coverage + complexity_score + upgrade_score + dep_score), details
 
 
 def compute_nile_score(
@@ -170,12 +234,25 @@ def compute_nile_score(
     essence_inputs: EssenceInputs,
     weights: dict[str, float] | None = None,
 ) -> NileScoreResult:
+    """Score a contract; the details breakdown is only built if result.details is read.
+
+    The dimension scores come from the same _*_parts helpers as compute_*_score,
+    summed here without building their breakdown dicts.
+    """
     w = weights or {"name": 0.25, "image": 0.25, "likeness": 0.25, "essence": 0.25}
 
-    name_score, name_details = compute_name_score(name_inputs)
-    image_score, image_details = compute_image_score(image_inputs)
-    likeness_score, likeness_details = compute_likeness_score(likeness_inputs)
-    essence_score, essence_details = compute_essence_score(essence_inputs)
+    source_score, audit_score, maturity_score, team_score, ecosystem = _name_parts(name_inputs)
+    name_score = _clamp(source_score + audit_score + maturity_score + team_score + ecosystem)
+
+    base, patch_bonus = _image_parts(image_inputs)
+    image_score = _clamp(base + patch_bonus + image_inputs.trend)
+
+    likeness_score = _clamp(
+        100.0 - likeness_inputs.slither_deductions - likeness_inputs.pattern_deductions
+    )
+
+    coverage, complexity_score, upgrade_score, dep_score = _essence_parts(essence_inputs)
+    essence_score = _clamp(coverage + complexity_score + upgrade_score + dep_score)
 
     total = (
         name_score * w["name"]
@@ -185,11 +262,7 @@ def compute_nile_score(
     )
     total = round(total, 2)
 
-    grade = "F"
-    for threshold, g in GRADE_MAP:
-        if total >= threshold:
-            grade = g
-            break
+    grade = grade_for(total)
 
     return NileScoreResult(
         total_score=total,
@@ -198,10 +271,214 @@ def compute_nile_score(
         likeness_score=round(likeness_score, 2),
         essence_score=round(essence_score, 2),
         grade=grade,
-        details={
-            "name": name_details,
-            "image": image_details,
-            "likeness": likeness_details,
-            "essence": essence_details,
-        },
+        inputs=(name_inputs, image_inputs, likeness_inputs, essence_inputs),
+    )
+
+
+# --- Batch scoring ---
+# NumPy is imported inside the batch functions so the scalar scorer (and the scan
+# worker that uses it) doesn't load it.
+
+
+@dataclass
+class NileBatchInputs:
+    """Scoring inputs for N contracts as parallel arrays (one element per contract).
+
+    Likeness findings are pre-bucketed into counts: Slither findings by severity and
+    EVMbench pattern matches by confidence band (>0.8, >0.6, >0.4).
+    """
+
+    # Name
+    is_verified: "np.ndarray"
+    audit_count: "np.ndarray"
+    age_days: "np.ndarray"
+    team_identified: "np.ndarray"
+    ecosystem_score: "np.ndarray"
+    # Image
+    open_critical: "np.ndarray"
+    open_high: "np.ndarray"
+    open_medium: "np.ndarray"
+    avg_patch_time_days: "np.ndarray"  # NaN when unknown
+    trend: "np.ndarray"
+    # Likeness
+    slither_high: "np.ndarray"
+    slither_medium: "np.ndarray"
+    slither_low: "np.ndarray"
+    pattern_high: "np.ndarray"
+    pattern_medium: "np.ndarray"
+    pattern_low: "np.ndarray"
+    # Essence
+    test_coverage_pct: "np.ndarray"
+    avg_cyclomatic_complexity: "np.ndarray"
+    has_proxy_pattern: "np.ndarray"
+    has_admin_keys: "np.ndarray"
+    has_timelock: "np.ndarray"
+    external_call_count: "np.ndarray"
+
+    @classmethod
+    def from_inputs(
+        cls,
+        name_inputs: Sequence[NameInputs],
+        image_inputs: Sequence[ImageInputs],
+        likeness_inputs: Sequence[LikenessInputs],
+        essence_inputs: Sequence[EssenceInputs],
+    ) -> "NileBatchInputs":
+        """Pack per-contract input dataclasses into arrays."""
+        import numpy as np
+
+        severity_counts = np.array(
+            [
+                np.bincount(
+                    np.asarray(li.slither_severities, dtype=np.intp),
+                    minlength=SEVERITY_UNKNOWN + 1,
+                )
+                for li in likeness_inputs
+            ],
+            dtype=np.float64,
+        ).reshape(-1, SEVERITY_UNKNOWN + 1)
+        band_counts = np.array(
+            [
+                np.bincount(
+                    np.searchsorted(CONFIDENCE_BANDS, li.pattern_confidences, side="left"),
+                    minlength=len(CONFIDENCE_BANDS) + 1,
+                )
+                for li in likeness_inputs
+            ],
+            dtype=np.float64,
+        ).reshape(-1, len(CONFIDENCE_BANDS) + 1)
+        return cls(
+            is_verified=np.array([n.is_verified for n in name_inputs], dtype=bool),
+            audit_count=np.array([n.audit_count for n in name_inputs], dtype=np.float64),
+            age_days=np.array([n.age_days for n in name_inputs], dtype=np.float64),
+            team_identified=np.array([n.team_identified for n in name_inputs], dtype=bool),
+            ecosystem_score=np.array([n.ecosystem_score for n in name_inputs], dtype=np.float64),
+            open_critical=np.array([i.open_critical for i in image_inputs], dtype=np.float64),
+            open_high=np.array([i.open_high for i in image_inputs], dtype=np.float64),
+            open_medium=np.array([i.open_medium for i in image_inputs], dtype=np.float64),
+            avg_patch_time_days=np.array(
+                [
+                    np.nan if i.avg_patch_time_days is None else i.avg_patch_time_days
+                    for i in image_inputs
+                ],
+                dtype=np.float64,
+            ),
+            trend=np.array([i.trend for i in image_inputs], dtype=np.float64),
+            slither_high=severity_counts[:, SEVERITY_CODES["high"]],
+            slither_medium=severity_counts[:, SEVERITY_CODES["medium"]],
+            slither_low=severity_counts[:, SEVERITY_CODES["low"]],
+            pattern_high=band_counts[:, 3],
+            pattern_medium=band_counts[:, 2],
+            pattern_low=band_counts[:, 1],
+            test_coverage_pct=np.array(
+                [e.test_coverage_pct for e in essence_inputs], dtype=np.float64
+            ),
+            avg_cyclomatic_complexity=np.array(
+                [e.avg_cyclomatic_complexity for e in essence_inputs], dtype=np.float64
+            ),
+            has_proxy_pattern=np.array([e.has_proxy_pattern for e in essence_inputs], dtype=bool),
+            has_admin_keys=np.array([e.has_admin_keys for e in essence_inputs], dtype=bool),
+            has_timelock=np.array([e.has_timelock for e in essence_inputs], dtype=bool),
+            external_call_count=np.array(
+                [e.external_call_count for e in essence_inputs], dtype=np.float64
+            ),
+        )
+
+
+@dataclass
+class NileBatchResult:
+    """Per-contract scores as arrays; same rounding and grading as NileScoreResult.
+
+    Breakdown dicts are not built here — call compute_nile_score for a contract
+    whose details are needed.
+    """
+
+    total_score: "np.ndarray"
+    name_score: "np.ndarray"
+    image_score: "np.ndarray"
+    likeness_score: "np.ndarray"
+    essence_score: "np.ndarray"
+    grade: "np.ndarray"
+
+
+def compute_nile_scores_batch(
+    inputs: NileBatchInputs,
+    weights: dict[str, float] | None = None,
+) -> NileBatchResult:
+    """Vectorized compute_nile_score over many contracts."""
+    import numpy as np
+
+    w = weights or {"name": 0.25, "image": 0.25, "likeness": 0.25, "essence": 0.25}
+
+    name = np.clip(
+        np.where(inputs.is_verified, 20.0, 0.0)
+        + np.minimum(20.0, inputs.audit_count * 6.67)
+        + np.where(inputs.age_days > 0, np.minimum(20.0, inputs.age_days / 365 * 20), 0.0)
+        + np.where(inputs.team_identified, 20.0, 5.0)
+        + np.minimum(20.0, inputs.ecosystem_score),
+        0.0,
+        100.0,
+    )
+
+    patch_days = inputs.avg_patch_time_days
+    has_patch_data = ~np.isnan(patch_days)
+    patch_bonus = np.maximum(0.0, 10 - np.where(has_patch_data, patch_days, 10.0))
+    image = np.clip(
+        100.0
+        - inputs.open_critical * 25
+        - inputs.open_high * 15
+        - inputs.open_medium * 5
+        + patch_bonus
+        + inputs.trend,
+        0.0,
+        100.0,
+    )
+
+    likeness = np.clip(
+        100.0
+        - (inputs.slither_high * 15 + inputs.slither_medium * 8 + inputs.slither_low * 3)
+        - (inputs.pattern_high * 20 + inputs.pattern_medium * 10 + inputs.pattern_low * 5),
+        0.0,
+        100.0,
+    )
+
+    essence = np.clip(
+        np.minimum(25.0, inputs.test_coverage_pct * 0.25)
+        + np.minimum(25.0, np.maximum(0.0, 25 - (inputs.avg_cyclomatic_complexity - 5) * 2.5))
+        + (
+            25.0
+            - np.where(inputs.has_proxy_pattern, 10.0, 0.0)
+            - np.where(inputs.has_admin_keys, 5.0, 0.0)
+            - np.where(inputs.has_timelock, 0.0, 5.0)
+        )
+        + np.maximum(0.0, 25 - inputs.external_call_count * 2),
+        0.0,
+        100.0,
+    )
+
+    # Same summation order as compute_nile_score (a matmul may reassociate), and
+    # Python's correctly rounded round() rather than np.round, which scales by 100
+    # and can land on the other side of a .xx5 tie
+    total = (
+        name * w["name"]
+        + image * w["image"]
+        + likeness * w["likeness"]
+        + essence * w["essence"]
+    )
+    total = _round2(total)
+    grade_idx = np.searchsorted(GRADE_THRESHOLDS, total, side="right") - 1
+    grade = np.array(GRADE_LETTERS)[np.maximum(grade_idx, 0)]
+
+    return NileBatchResult(
+        total_score=total,
+        name_score=_round2(name),
+        image_score=_round2(image),
+        likeness_score=_round2(likeness),
+        essence_score=_round2(essence),
+        grade=grade,
     )
+
+
+def _round2(values: "np.ndarray") -> "np.ndarray":
+    import numpy as np
+
+    return np.array([round(v, 2) for v in values.tolist()], dtype=np.float64)
@@ -9,7 +9,7 @@ Re-maps the NILE framework from smart contract security to human identity:
 
 from dataclasses import dataclass, field
 
-from nile.services.nile_scorer import GRADE_MAP, _clamp
+from nile.services.nile_scorer import _clamp, grade_for
 
 
 @dataclass
@@ -242,11 +242,7 @@ def compute_person_valuation(
         2,
     )
 
-    grade = "F"
-    for threshold, g in GRADE_MAP:
-        if total >= threshold:
-            grade = g
-            break
+    grade = grade_for(total)
 
     # Fair value estimation
     base_value = BASE_VALUES.get(name_inputs.verification_level, 1_000)
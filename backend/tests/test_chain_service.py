@@ -0,0 +1,254 @@
+"""Tests for ChainService against an in-memory fake web3."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from web3 import AsyncHTTPProvider, AsyncWeb3
+from web3.exceptions import TimeExhausted
+
+from nile.services import chain_service as chain_module
+from nile.services.chain_service import (
+    GET_TOKEN_PAIR_CALL,
+    LATEST_ROUND_DATA_SELECTOR,
+    QUOTE_BATCH_SIZE,
+    ChainService,
+)
+
+DEPLOYER = "0x" + "aa" * 20
+
+
+class FakeEth:
+    def __init__(self, pending_nonce: int = 7) -> None:
+        self.pending_nonce = pending_nonce
+        self.sent: list[int] = []
+        self.fail_send_nonces: set[int] = set()
+
+    async def get_transaction_count(self, address: str, block: str) -> int:
+        return self.pending_nonce
+
+    async def send_raw_transaction(self, raw: dict) -> bytes:
+        await asyncio.sleep(0)
+        if raw["nonce"] in self.fail_send_nonces:
+            raise ValueError("replacement transaction underpriced")
+        self.sent.append(raw["nonce"])
+        return raw["nonce"].to_bytes(32, "big")
+
+    async def wait_for_transaction_receipt(self, tx_hash: bytes) -> dict:
+        return {"status": 1}
+
+
+class FakeFunction:
+    def __init__(self, reverts: bool = False) -> None:
+        self.reverts = reverts
+
+    async def build_transaction(self, tx: dict) -> dict:
+        await asyncio.sleep(0)
+        if self.reverts:
+            raise ValueError("execution reverted")
+        assert "nonce" not in tx
+        return {**tx, "gas": 100_000}
+
+
+class FakeAccount:
+    address = DEPLOYER
+
+    def sign_transaction(self, tx: dict) -> SimpleNamespace:
+        return SimpleNamespace(raw_transaction=tx)
+
+
+def make_service(eth: FakeEth) -> ChainService:
+    service = ChainService()
+    service._w3 = SimpleNamespace(eth=eth, provider=None)
+    service._http_session_ready = True  # skip transport setup
+    return service
+
+
+async def test_failed_gas_estimate_does_not_burn_a_nonce():
+    eth = FakeEth(pending_nonce=7)
+    service = make_service(eth)
+    account = FakeAccount()
+
+    results = await asyncio.gather(
+        service._transact(FakeFunction(), account),
+        service._transact(FakeFunction(reverts=True), account),
+        service._transact(FakeFunction(), account),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[1], ValueError)
+    assert sorted(eth.sent) == [7, 8]
+    assert service._next_nonce == 9
+
+
+async def test_failed_send_resyncs_and_refills_the_gap():
+    eth = FakeEth(pending_nonce=4)
+    eth.fail_send_nonces = {4}
+    service = make_service(eth)
+    account = FakeAccount()
+
+    # 4 fails to send while 5 is already out, leaving a gap at the node
+    results = await asyncio.gather(
+        service._transact(FakeFunction(), account),
+        service._transact(FakeFunction(), account),
+        return_exceptions=True,
+    )
+    assert isinstance(results[0], ValueError)
+    assert eth.sent == [5]
+    assert service._next_nonce is None
+
+    # The node still reports 4 as its next nonce, so the next send fills the gap
+    eth.fail_send_nonces = set()
+    await service._transact(FakeFunction(), account)
+    assert eth.sent == [5, 4]
+
+
+async def test_receipt_timeout_resyncs_nonce():
+    eth = FakeEth(pending_nonce=3)
+    service = make_service(eth)
+    account = FakeAccount()
+
+    async def dropped(tx_hash: bytes) -> dict:
+        raise TimeExhausted("not mined")
+
+    eth.wait_for_transaction_receipt = dropped
+    with pytest.raises(TimeExhausted):
+        await service._transact(FakeFunction(), account)
+    assert service._next_nonce is None
+
+
+# --- Reads ---
+
+CODEC = AsyncWeb3().codec
+FACTORY = "0x" + "fa" * 20
+ROUTER = "0x" + "0e" * 20
+
+
+class FakeReadEth:
+    """Answers eth_call for the price feed, getTokenPair and quotes; counts calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.price = 3000_00000000
+        self.pairs: dict[bytes, tuple[str, str]] = {}
+
+    async def call(self, params: dict) -> bytes:
+        self.calls += 1
+        data = params["data"]
+        if data == LATEST_ROUND_DATA_SELECTOR:
+            return CODEC.encode(
+                ["uint80", "int256", "uint256", "uint256", "uint80"], [1, self.price, 0, 0, 1]
+            )
+        args = bytes.fromhex(data[10:])
+        if data.startswith(GET_TOKEN_PAIR_CALL[0]):
+            (person_id,) = CODEC.decode(["bytes16"], args)
+            zero = "0x" + "00" * 20
+            return CODEC.encode(["address", "address"], self.pairs.get(person_id, (zero, zero)))
+        _, amount = CODEC.decode(["bytes16", "uint256"], args)
+        # Later requests answer first, so ordering has to come from the caller
+        await asyncio.sleep(0.001 * (100 - amount))
+        return CODEC.encode(["uint256", "uint256"], [amount * 2, amount])
+
+
+class FakeBatch:
+    def __init__(self) -> None:
+        self.pending = []
+
+    async def __aenter__(self) -> "FakeBatch":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    def add(self, request) -> None:
+        self.pending.append(request)
+
+    async def async_execute(self) -> list:
+        return list(await asyncio.gather(*self.pending))
+
+
+def make_reader(eth: FakeReadEth) -> ChainService:
+    service = ChainService()
+    service._w3 = SimpleNamespace(
+        eth=eth, provider=None, codec=CODEC, batch_requests=FakeBatch
+    )
+    service._http_session_ready = True
+    service._factory = SimpleNamespace(address=FACTORY)
+    service._router = SimpleNamespace(address=ROUTER)
+    return service
+
+
+def person(n: int) -> bytes:
+    return n.to_bytes(16, "big")
+
+
+async def test_eth_price_cached_until_ttl_expires():
+    eth = FakeReadEth()
+    service = make_reader(eth)
+
+    assert await service.get_eth_price_usd() == 3000.0
+    eth.price = 3100_00000000
+    assert await service.get_eth_price_usd() == 3000.0
+    assert eth.calls == 1
+
+    price, _ = service._eth_price
+    service._eth_price = (price, 0.0)  # expire the cached entry
+    assert await service.get_eth_price_usd() == 3100.0
+    assert eth.calls == 2
+
+
+async def test_token_pair_lru_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(chain_module, "TOKEN_PAIR_CACHE_SIZE", 2)
+    eth = FakeReadEth()
+    for n in (1, 2, 3):
+        eth.pairs[person(n)] = ("0x" + f"{n:02x}" * 20, "0x" + f"{n + 10:02x}" * 20)
+    service = make_reader(eth)
+
+    await service.get_token_pair(person(1))
+    await service.get_token_pair(person(2))
+    await service.get_token_pair(person(1))  # hit; person 2 is now least recent
+    assert eth.calls == 2
+    await service.get_token_pair(person(3))  # evicts person 2
+
+    assert list(service._token_pairs) == [person(1), person(3)]
+    await service.get_token_pair(person(2))
+    assert eth.calls == 4
+
+
+async def test_undeployed_token_pair_is_not_cached():
+    eth = FakeReadEth()
+    service = make_reader(eth)
+
+    token, _ = await service.get_token_pair(person(1))
+    assert int(token, 16) == 0
+
+    # Deployed elsewhere; the next lookup must see it
+    eth.pairs[person(1)] = ("0x" + "11" * 20, "0x" + "22" * 20)
+    token, _ = await service.get_token_pair(person(1))
+    assert int(token, 16) == int("11" * 20, 16)
+    assert eth.calls == 2
+
+
+async def test_quotes_bulk_results_follow_request_order():
+    service = make_reader(FakeReadEth())
+    requests = [(person(1), amount, "buy" if amount % 2 else "sell") for amount in range(45)]
+    assert len(requests) > 2 * QUOTE_BATCH_SIZE
+
+    quotes = await service.get_quotes_bulk(requests)
+
+    assert quotes == [(amount * 2, amount) for _, amount, _ in requests]
+
+
+async def test_quotes_bulk_rejects_unknown_kind():
+    service = make_reader(FakeReadEth())
+    with pytest.raises(ValueError):
+        await service.get_quotes_bulk([(person(1), 1, "swap")])
+
+
+def test_orjson_codec_keeps_wide_integers_exact():
+    provider = chain_module._with_orjson(AsyncHTTPProvider)("http://localhost:8545")
+    wide = 123456789012345678901234567890
+    raw = b'{"jsonrpc":"2.0","id":1,"result":{"n":[1, %d],"hex":"0x1"}}' % wide
+
+    assert provider.decode_rpc_response(raw)["result"]["n"] == [1, wide]
+    assert provider.decode_rpc_response(b'{"id":2,"result":18}')["result"] == 18
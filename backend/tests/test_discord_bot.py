@@ -0,0 +1,164 @@
+"""Tests for the Discord bot's channel bookkeeping and event fan-out."""
+
+import asyncio
+import random
+from types import SimpleNamespace
+
+import discord
+import orjson
+
+from nile.discord import screenshots
+from nile.discord.bot import MAX_EMBED_CHARS, MAX_EMBEDS_PER_MESSAGE, NileBot
+from nile.discord.screenshots import ScreenshotSession
+
+
+async def test_deleted_channel_is_forgotten_by_id():
+    bot = NileBot()
+    created = SimpleNamespace(id=42, name="nile-feed")
+    bot._channels["nile-feed"] = created
+    bot._channel_locks[created.id]
+
+    # The gateway delivers its own cached object for the deleted channel
+    await bot.on_guild_channel_delete(SimpleNamespace(id=42, name="nile-feed"))
+
+    assert "nile-feed" not in bot._channels
+    assert 42 not in bot._channel_locks
+
+
+async def test_unrelated_channel_with_same_name_is_ignored():
+    bot = NileBot()
+    bot._channels["nile-feed"] = SimpleNamespace(id=42, name="nile-feed")
+
+    await bot.on_guild_channel_delete(SimpleNamespace(id=7, name="nile-feed"))
+
+    assert bot._channels["nile-feed"].id == 42
+
+
+async def test_concurrent_captures_share_one_browser_launch(monkeypatch):
+    launches = 0
+
+    async def fake_restart(self: ScreenshotSession) -> bool:
+        nonlocal launches
+        launches += 1
+        await asyncio.sleep(0.01)  # launching takes a while
+        self._browser = SimpleNamespace(is_connected=lambda: True)
+        return True
+
+    async def fake_screenshot(browser: object, base_url: str, path: str) -> bytes:
+        return path.encode()
+
+    monkeypatch.setattr(ScreenshotSession, "_restart", fake_restart)
+    monkeypatch.setattr(screenshots, "_screenshot", fake_screenshot)
+    session = ScreenshotSession()
+
+    # The worker's first page and a /nile-leaderboard command arrive together
+    pngs = await asyncio.gather(
+        session.capture("http://frontend", "/"),
+        session.capture("http://frontend", "/agents"),
+        session.start(),
+    )
+
+    assert pngs == [b"/", b"/agents", True]
+    assert launches == 1
+
+
+async def test_pending_sends_count_only_event_sends():
+    bot = NileBot()
+    release = asyncio.Event()
+
+    async def slow_send(**kwargs: object) -> None:
+        await release.wait()
+
+    bot._channels["nile-feed"] = SimpleNamespace(id=1, name="nile-feed", send=slow_send)
+    bot._route_events([{"data": orjson.dumps({"event_type": "task.claimed"})}])
+    bot._spawn(release.wait())  # e.g. a screenshot upload
+    await asyncio.sleep(0)
+
+    assert len(bot._event_sends) == 1
+    assert len(bot._background_tasks) == 2
+
+    release.set()
+    await asyncio.gather(*bot._background_tasks)
+    assert not bot._event_sends
+
+
+class FakeChannel:
+    """Records each message's embeds after a random delay, like a slow Discord API."""
+
+    def __init__(self, channel_id: int, name: str, rng: random.Random) -> None:
+        self.id = channel_id
+        self.name = name
+        self.rng = rng
+        self.messages: list[list[discord.Embed]] = []
+
+    async def send(self, embeds: list[discord.Embed]) -> None:
+        await asyncio.sleep(self.rng.uniform(0, 0.002))
+        self.messages.append(embeds)
+
+
+def make_fanout_bot(rng: random.Random) -> NileBot:
+    bot = NileBot()
+    bot._channels["nile-feed"] = FakeChannel(1, "nile-feed", rng)
+    bot._channels["nile-alerts"] = FakeChannel(2, "nile-alerts", rng)
+    return bot
+
+
+async def drain(bot: NileBot) -> None:
+    while bot._background_tasks:
+        await asyncio.gather(*bot._background_tasks)
+
+
+async def test_fanout_keeps_per_channel_order_and_message_limits():
+    rng = random.Random(7)  # noqa: S311
+    bot = make_fanout_bot(rng)
+    expected: dict[str, list[int]] = {"nile-feed": [], "nile-alerts": []}
+
+    seq = 0
+    for _ in range(40):
+        batch = []
+        for _ in range(rng.randrange(1, 30)):
+            seq += 1
+            if rng.random() < 0.3:
+                event_type = "contribution.detection"
+                metadata = {"seq": seq, "severity": "critical"}
+                expected["nile-alerts"].append(seq)
+            else:
+                event_type = "task.claimed"
+                metadata = {"seq": seq}
+                expected["nile-feed"].append(seq)
+            batch.append({"data": orjson.dumps({"event_type": event_type, "metadata": metadata})})
+        bot._route_events(batch)
+        await asyncio.sleep(rng.uniform(0, 0.001))  # the listener keeps reading meanwhile
+    await drain(bot)
+
+    for name, seqs in expected.items():
+        messages = bot._channels[name].messages
+        sent = [int(embed.fields[0].value) for message in messages for embed in message]
+        assert sent == seqs
+        for message in messages:
+            assert 1 <= len(message) <= MAX_EMBEDS_PER_MESSAGE
+            assert sum(len(embed) for embed in message) <= MAX_EMBED_CHARS
+
+
+async def test_send_embeds_packs_by_count_and_size():
+    bot = make_fanout_bot(random.Random(0))  # noqa: S311
+    channel = bot._channels["nile-feed"]
+
+    await bot._send_embeds(channel, [discord.Embed(title=str(i)) for i in range(23)])
+    assert [len(m) for m in channel.messages] == [10, 10, 3]
+
+    channel.messages.clear()
+    # 2500 characters each: two fit under the 6000 limit, a third doesn't
+    await bot._send_embeds(channel, [discord.Embed(description="x" * 2500) for _ in range(5)])
+    assert [len(m) for m in channel.messages] == [2, 2, 1]
+
+
+async def test_burst_for_one_channel_is_grouped_into_one_message():
+    bot = make_fanout_bot(random.Random(0))  # noqa: S311
+    events = [{"event_type": "task.claimed", "metadata": {"seq": n}} for n in range(7)]
+
+    bot._route_events([{"data": orjson.dumps(event)} for event in events])
+    await drain(bot)
+
+    assert [len(m) for m in bot._channels["nile-feed"].messages] == [7]
+    assert bot._channels["nile-alerts"].messages == []
@@ -1,15 +1,20 @@
 """Tests for the NILE scoring engine."""
 
+import dataclasses
+import random
+
 from nile.services.nile_scorer import (
     EssenceInputs,
     ImageInputs,
     LikenessInputs,
     NameInputs,
+    NileBatchInputs,
     compute_essence_score,
     compute_image_score,
     compute_likeness_score,
     compute_name_score,
     compute_nile_score,
+    compute_nile_scores_batch,
 )
 
 
@@ -56,6 +61,14 @@ def test_likeness_score_high_confidence_match():
     assert details["evmbench_match_count"] == 2
 
 
+def test_likeness_derived_fields_follow_findings():
+    inputs = LikenessInputs(slither_findings=[{"severity": "high"}])
+    cleared = dataclasses.replace(inputs, slither_findings=[])
+    assert compute_likeness_score(cleared)[0] == 100.0
+    assert cleared == LikenessInputs()
+    assert inputs != LikenessInputs()
+
+
 def test_essence_score_well_tested():
     inputs = EssenceInputs(
         test_coverage_pct=90.0,
@@ -113,3 +126,95 @@ def test_grade_assignment():
     )
     assert result.grade == "A+"
     assert result.total_score >= 90
+
+
+SCORING_CASES = [
+    (
+        NameInputs(is_verified=True, audit_count=2, age_days=365, team_identified=True),
+        ImageInputs(open_critical=0, open_high=1, avg_patch_time_days=3.0, trend=-2.0),
+        LikenessInputs(
+            slither_findings=[{"severity": "medium"}, {"severity": "high"}, {}],
+            evmbench_pattern_matches=[{"confidence": 0.5}, {"confidence": 0.85}],
+        ),
+        EssenceInputs(test_coverage_pct=80.0, avg_cyclomatic_complexity=6.0),
+    ),
+    (
+        NameInputs(),
+        ImageInputs(open_critical=5),
+        LikenessInputs(evmbench_pattern_matches=[{"confidence": 0.7}] * 8),
+        EssenceInputs(has_proxy_pattern=True, has_timelock=False, external_call_count=20),
+    ),
+    (
+        NameInputs(
+            is_verified=True, audit_count=3, age_days=730,
+            team_identified=True, ecosystem_score=20,
+        ),
+        ImageInputs(trend=5),
+        LikenessInputs(),
+        EssenceInputs(test_coverage_pct=95, avg_cyclomatic_complexity=3),
+    ),
+]
+
+
+def random_case(rng: random.Random) -> tuple:
+    # Two-decimal inputs land on .xx5 ties often enough to catch rounding drift
+    return (
+        NameInputs(
+            is_verified=rng.random() < 0.5,
+            audit_count=rng.randrange(5),
+            age_days=rng.randrange(1500),
+            team_identified=rng.random() < 0.5,
+            ecosystem_score=round(rng.uniform(0, 25), 2),
+        ),
+        ImageInputs(
+            open_critical=rng.randrange(3),
+            open_high=rng.randrange(4),
+            open_medium=rng.randrange(6),
+            avg_patch_time_days=rng.choice([None, round(rng.uniform(0, 15), 2)]),
+            trend=round(rng.uniform(-10, 10), 2),
+        ),
+        LikenessInputs(
+            slither_findings=[
+                {"severity": rng.choice(["info", "low", "medium", "high", "other"])}
+                for _ in range(rng.randrange(5))
+            ],
+            evmbench_pattern_matches=[
+                {"confidence": round(rng.random(), 2)} for _ in range(rng.randrange(4))
+            ],
+        ),
+        EssenceInputs(
+            test_coverage_pct=rng.randrange(101),
+            avg_cyclomatic_complexity=round(rng.uniform(1, 15), 1),
+            has_proxy_pattern=rng.random() < 0.5,
+            has_admin_keys=rng.random() < 0.5,
+            has_timelock=rng.random() < 0.5,
+            external_call_count=rng.randrange(15),
+        ),
+    )
+
+
+def test_composite_matches_dimension_scores():
+    # compute_nile_score skips the breakdown dicts; its scores must still agree
+    rng = random.Random(20240602)  # noqa: S311
+    cases = SCORING_CASES + [random_case(rng) for _ in range(500)]
+    for name, image, likeness, essence in cases:
+        result = compute_nile_score(name, image, likeness, essence)
+        assert result.name_score == round(compute_name_score(name)[0], 2)
+        assert result.image_score == round(compute_image_score(image)[0], 2)
+        assert result.likeness_score == round(compute_likeness_score(likeness)[0], 2)
+        assert result.essence_score == round(compute_essence_score(essence)[0], 2)
+
+
+def test_batch_scores_match_scalar():
+    rng = random.Random(20240601)  # noqa: S311
+    cases = SCORING_CASES + [random_case(rng) for _ in range(3000)]
+    batch = compute_nile_scores_batch(NileBatchInputs.from_inputs(*zip(*cases, strict=True)))
+
+    for i, case in enumerate(cases):
+        expected = compute_nile_score(*case)
+        assert batch.total_score[i] == expected.total_score, case
+        assert batch.name_score[i] == expected.name_score, case
+        assert batch.image_score[i] == expected.image_score, case
+        assert batch.likeness_score[i] == expected.likeness_score, case
+        assert batch.essence_score[i] == expected.essence_score, case
+        assert batch.grade[i] == expected.grade, case